@@ -46,7 +46,7 @@ class CameraApp:
     
     Attributes:
         root (tk.Tk): Main tkinter window
-        picam2 (Optional[Picamera2]): Camera instance (owned by preview_window, stored here for reference)
+        preview_window (Optional[PreviewWindow]): Preview window; owns picam2 and the capture manager
         robocam (RoboCam): Printer control instance
         running (bool): Application running state
         step_size_type (tk.StringVar): Current step size selection ("0.1", "1.0", "10.0", or "custom")
@@ -116,13 +116,6 @@ class CameraApp:
             except Exception as e:
                 print(f"Warning: Failed to create preview window: {e}")
         
-        # Store reference to picam2 from preview_window for cleanup (if needed)
-        self.picam2: Optional[Picamera2] = None
-        self.capture_manager: Optional[CaptureManager] = None
-        if self.preview_window is not None:
-            self.picam2 = getattr(self.preview_window, 'picam2', None)
-            self.capture_manager = getattr(self.preview_window, 'capture_manager', None)
-        
         # Calculate and set proper initial window size
         self.root.update_idletasks()
         
@@ -881,9 +874,14 @@ class CameraApp:
             self.position_label.config(text="N/A, N/A, N/A")
             return
         
-        x = self.robocam.X if self.robocam.X is not None else 0.0
-        y = self.robocam.Y if self.robocam.Y is not None else 0.0
-        z = self.robocam.Z if self.robocam.Z is not None else 0.0
+        try:
+            x = self.robocam.X if self.robocam.X is not None else 0.0
+            y = self.robocam.Y if self.robocam.Y is not None else 0.0
+            z = self.robocam.Z if self.robocam.Z is not None else 0.0
+        except RuntimeError:
+            # Position query after a move failed: the position is unknown
+            self.position_label.config(text="N/A, N/A, N/A")
+            return
         position = f"{x:.2f}, {y:.2f}, {z:.2f}"
         self.position_label.config(text=position)
 
@@ -897,16 +895,20 @@ class CameraApp:
         self.running = False
         
         # Close preview window (it owns picam2 and capture_manager, so this cleans them up)
+        picam2: Optional[Picamera2] = None
+        capture_manager: Optional[CaptureManager] = None
         if self.preview_window is not None:
+            # Looked up now: the preview window creates them after it is shown
+            picam2, capture_manager = self.preview_window.get_camera_handles()
             try:
                 self.preview_window.destroy()
             except Exception as e:
                 print(f"Error closing preview window: {e}")
         
         # Additional cleanup as fallback (preview_window should have handled this)
-        if self.capture_manager is not None:
+        if capture_manager is not None:
             try:
-                self.capture_manager.cleanup()
+                capture_manager.cleanup()
             except Exception as e:
                 print(f"Error cleaning up capture manager: {e}")
         
@@ -919,8 +921,8 @@ class CameraApp:
 
         # Additional cleanup as fallback (preview_window should have handled this)
         try:
-            if self.picam2 is not None:
-                self.picam2.stop()
+            if picam2 is not None:
+                picam2.stop()
         except Exception:
             pass
         
@@ -1062,9 +1062,14 @@ class PreviewApp:
             self.position_label.config(text="N/A, N/A, N/A")
             return
         
-        x = self.robocam.X if self.robocam.X is not None else 0.0
-        y = self.robocam.Y if self.robocam.Y is not None else 0.0
-        z = self.robocam.Z if self.robocam.Z is not None else 0.0
+        try:
+            x = self.robocam.X if self.robocam.X is not None else 0.0
+            y = self.robocam.Y if self.robocam.Y is not None else 0.0
+            z = self.robocam.Z if self.robocam.Z is not None else 0.0
+        except RuntimeError:
+            # Position query after a move failed: the position is unknown
+            self.position_label.config(text="N/A, N/A, N/A")
+            return
         position = f"{x:.2f}, {y:.2f}, {z:.2f}"
         self.position_label.config(text=position)
 
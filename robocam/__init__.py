@@ -19,7 +19,7 @@ from .robocam_ccc import RoboCam
 from .laser import Laser
 from .pihqcamera import PiHQCamera
 from .stentorcam import StentorCam, WellPlatePathGenerator
-from .camera_preview import start_best_preview, FPSTracker, has_desktop_session
+from .camera_preview import start_best_preview, FPSTracker, CountingFPSTracker, has_desktop_session
 from .config import Config, get_config, reset_config
 from .logging_config import setup_logging, get_logger
 
@@ -31,6 +31,7 @@ __all__ = [
     'WellPlatePathGenerator',
     'start_best_preview',
     'FPSTracker',
+    'CountingFPSTracker',
     'has_desktop_session',
     'Config',
     'get_config',
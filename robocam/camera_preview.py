@@ -10,7 +10,7 @@ Author: RoboCam-Suite
 import os
 import time
 from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 from picamera2 import Picamera2, Preview
 
 
@@ -113,3 +113,56 @@ class FPSTracker:
         """Clear all timestamps."""
         self.timestamps.clear()
 
+
+class CountingFPSTracker:
+    """
+    FPS tracker for per-frame camera callbacks.
+    
+    Same public methods as FPSTracker (update, get_fps, reset), but update() is a single integer increment (no timestamp or deque work per frame);
+    the rate is computed in get_fps() from the frame count and time elapsed since the
+    previous sample, re-sampled at most every min_interval seconds.
+    
+    Attributes:
+        count (int): Frames counted since creation or the last reset()
+        min_interval (float): Minimum seconds between FPS samples
+    """
+    
+    def __init__(self, min_interval: float = 1.0) -> None:
+        """
+        Initialize counting FPS tracker.
+        
+        Args:
+            min_interval: Minimum seconds between FPS samples in get_fps()
+        """
+        self.count: int = 0
+        self.min_interval: float = min_interval
+        self._last_sample: Tuple[float, int] = (time.monotonic(), 0)
+        self._fps: float = 0.0
+    
+    def update(self, request=None) -> None:
+        """Count a new frame; the optional argument lets it serve as a Picamera2 post_callback."""
+        self.count += 1
+    
+    on_frame = update
+    
+    def get_fps(self) -> float:
+        """
+        Calculate FPS from frames counted since the previous sample.
+        
+        Returns:
+            FPS over the last sample interval, or 0.0 before the first full interval
+        """
+        now = time.monotonic()
+        count = self.count
+        last_time, last_count = self._last_sample
+        dt = now - last_time
+        if dt >= self.min_interval:
+            self._fps = (count - last_count) / dt
+            self._last_sample = (now, count)
+        return self._fps
+    
+    def reset(self) -> None:
+        """Reset the frame count and FPS sample."""
+        self.count = 0
+        self._last_sample = (time.monotonic(), 0)
+        self._fps = 0.0
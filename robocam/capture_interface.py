@@ -285,11 +285,8 @@ class CaptureManager:
         if frame is not None:
             if self._laser_on:
                 frame = self._draw_laser_indicator(frame)
-            grayscale = "Grayscale" in self.capture_type
-            if grayscale and frame.ndim == 2:
-                self._video_writer.write(cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR))
-            else:
-                self._video_writer.write(frame)
+            # Grayscale writers are opened with isColor=False and take 2D frames as is
+            self._video_writer.write(frame)
             self._frames_captured += 1
             return True
         return False
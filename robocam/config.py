@@ -35,10 +35,10 @@ class Config:
             "printer": {
                 "baudrate": 115200,
                 "timeout": 10.0,
+                "readline_timeout": 0.05,
                 "home_timeout": 90.0,
                 "movement_wait_timeout": 30.0,
                 "command_delay": 0.1,
-                "position_update_delay": 0.1,
                 "connection_retry_delay": 2.0,
                 "max_retries": 5
             },
@@ -49,7 +49,8 @@ class Config:
             "camera": {
                 "preview_resolution": [800, 600],
                 "default_fps": 30.0,
-                "preview_backend": "auto"
+                "preview_backend": "auto",
+                "stop_settle_s": 0.05
             }
         },
         "paths": {
@@ -239,6 +240,40 @@ class Config:
         # Set the value
         config[keys[-1]] = value
     
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values (dot notation keys) in one call.
+        
+        All parent sections are resolved before any value is written, so a bad
+        key leaves the configuration untouched instead of partially updated.
+        
+        Args:
+            values: Mapping of dot notation keys to values
+            
+        Examples:
+            config.update({
+                "hardware.camera.last_measured_fps": 58.2,
+                "hardware.camera.last_target_fps": 60.0,
+            })
+        """
+        pending = []
+        for key, value in values.items():
+            keys = key.split('.')
+            config = self.config
+            for k in keys[:-1]:
+                config = config.get(k)
+                if config is None:
+                    break  # Missing sections are created in the write pass
+                if not isinstance(config, dict):
+                    raise TypeError(f"Cannot set '{key}': '{k}' is not a configuration section")
+            pending.append((keys, value))
+        
+        for keys, value in pending:
+            config = self.config
+            for k in keys[:-1]:
+                config = config.setdefault(k, {})
+            config[keys[-1]] = value
+    
     def validate(self) -> None:
         """
         Validate configuration values.
@@ -28,12 +28,16 @@ import atexit
 import time
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from picamera2 import Picamera2
 from robocam.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Fast PNG compression for frame dumps (default level 3 roughly doubles encode time)
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 
 class Picamera2HighFpsCapture:
     """
@@ -190,10 +194,16 @@ class Picamera2HighFpsCapture:
             self.stop_capture()
             return False
     
-    def read_frame(self) -> Optional[np.ndarray]:
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
         """
         Read a single frame from the camera stream.
         
+        Blocks until Picamera2 delivers the next frame, so callers do not need
+        to poll with sleeps.
+        
+        Args:
+            timeout: Optional maximum seconds to wait for the frame (None waits indefinitely)
+        
         Returns:
             Grayscale frame as numpy array (height, width), or None if error
         """
@@ -205,7 +215,10 @@ class Picamera2HighFpsCapture:
             # Use capture_array for high-FPS - more efficient than capture_request
             # For Y format, this directly returns the Y plane as a 2D array
             # For YUV420, we'll extract the Y channel
-            frame = self.picam2.capture_array("main")
+            if timeout is None:
+                frame = self.picam2.capture_array("main")
+            else:
+                frame = self.picam2.capture_array("main", wait=timeout)
             
             if frame is None:
                 logger.warning("Received empty frame")
@@ -230,7 +243,8 @@ class Picamera2HighFpsCapture:
     
     def capture_frame_sequence(self, num_frames: int, 
                                save_individual: bool = False,
-                               output_dir: Optional[str] = None) -> List[np.ndarray]:
+                               output_dir: Optional[str] = None,
+                               return_frames: bool = True) -> List[np.ndarray]:
         """
         Capture a sequence of frames.
         
@@ -238,31 +252,48 @@ class Picamera2HighFpsCapture:
             num_frames: Number of frames to capture
             save_individual: If True, save each frame as PNG file
             output_dir: Directory to save individual frames (if save_individual is True)
+            return_frames: If False, frames are only written to disk and not kept in memory
             
         Returns:
-            List of captured frames as numpy arrays
+            List of captured frames as numpy arrays (empty if return_frames is False)
         """
         frames = []
         start_time = time.time()
+        # PNG encoding runs on worker threads (libpng releases the GIL) so it does not
+        # slow down the capture loop
+        writer = ThreadPoolExecutor(max_workers=os.cpu_count() or 1) if save_individual and output_dir else None
+        pending = []
+        count = 0
+        timestamp = time.strftime('%Y%m%d_%H%M%S')  # Same for the whole sequence
         
-        for i in range(num_frames):
-            frame = self.read_frame()
-            if frame is None:
-                logger.warning(f"Failed to capture frame {i+1}/{num_frames}")
-                continue
-            
-            frames.append(frame.copy())
-            
-            # Save individual frame if requested
-            if save_individual and output_dir:
-                timestamp = time.strftime('%Y%m%d_%H%M%S')
-                frame_path = os.path.join(output_dir, f"frame_{i:06d}_{timestamp}.png")
-                cv2.imwrite(frame_path, frame)
+        try:
+            for i in range(num_frames):
+                frame = self.read_frame()
+                if frame is None:
+                    logger.warning(f"Failed to capture frame {i+1}/{num_frames}")
+                    continue
+                
+                # read_frame() returns a new array per frame, so it can be kept/written as is
+                if return_frames:
+                    frames.append(frame)
+                count += 1
+                
+                # Save individual frame if requested
+                if writer is not None:
+                    frame_path = os.path.join(output_dir, f"frame_{i:06d}_{timestamp}.png")
+                    pending.append(writer.submit(cv2.imwrite, frame_path, frame, _PNG_PARAMS))
+        finally:
+            if writer is not None:
+                writer.shutdown(wait=True)
+        
+        failed = sum(1 for f in pending if f.exception() is not None or not f.result())
+        if failed:
+            logger.warning(f"Failed to save {failed}/{len(pending)} frame PNGs to {output_dir}")
         
         elapsed = time.time() - start_time
         if elapsed > 0:
-            actual_fps = len(frames) / elapsed
-            logger.info(f"Captured {len(frames)} frames in {elapsed:.2f}s ({actual_fps:.1f} FPS)")
+            actual_fps = count / elapsed
+            logger.info(f"Captured {count} frames in {elapsed:.2f}s ({actual_fps:.1f} FPS)")
         
         return frames
     
@@ -321,10 +352,10 @@ class Picamera2HighFpsCapture:
             base_path = os.path.splitext(output_path)[0]
             output_path = base_path + ext
         
-        # Convert grayscale frames to BGR for video codec
-        # Most codecs require 3-channel images
+        # Write single-channel frames directly (FFV1/PNG accept 8-bit gray), avoiding a
+        # GRAY->BGR expansion that triples the data handed to the encoder
         height, width = self.frames[0].shape
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height), isColor=True)
+        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height), isColor=False)
         
         if not out.isOpened():
             logger.error(f"Failed to open video writer for {output_path}")
@@ -333,9 +364,7 @@ class Picamera2HighFpsCapture:
         logger.info(f"Saving {len(self.frames)} frames to {output_path} using {codec} codec @ {fps} FPS")
         
         for i, frame in enumerate(self.frames):
-            # Convert grayscale to BGR (3-channel)
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-            out.write(frame_bgr)
+            out.write(frame)
             
             if (i + 1) % 100 == 0:
                 logger.debug(f"Saved {i+1}/{len(self.frames)} frames")
@@ -363,12 +392,13 @@ class Picamera2HighFpsCapture:
         
         logger.info(f"Saving {len(self.frames)} frames as PNG sequence to {output_dir}")
         
-        for i, frame in enumerate(self.frames):
-            frame_path = os.path.join(output_dir, f"{prefix}_{i:06d}.png")
-            cv2.imwrite(frame_path, frame)
-            
-            if (i + 1) % 100 == 0:
-                logger.debug(f"Saved {i+1}/{len(self.frames)} frames")
+        paths = [os.path.join(output_dir, f"{prefix}_{i:06d}.png") for i in range(len(self.frames))]
+        # zlib DEFLATE dominates PNG writes and releases the GIL: encode on all cores
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            results = list(pool.map(lambda path, frame: cv2.imwrite(path, frame, _PNG_PARAMS), paths, self.frames))
+        failed = results.count(False)
+        if failed:
+            logger.warning(f"Failed to write {failed}/{len(results)} PNG frames")
         
         logger.info(f"Successfully saved {len(self.frames)} PNG frames to {output_dir}")
         return True
@@ -509,6 +539,7 @@ class Picamera2HighFpsCapture:
             return 0
 
         frames_written = 0
+        frames_skipped = 0
         start_time = time.perf_counter()
 
         try:
@@ -520,7 +551,10 @@ class Picamera2HighFpsCapture:
 
                 frame = self.read_frame()
                 if frame is None:
-                    logger.warning("Skipping empty frame during FFmpeg recording")
+                    # Retry immediately; warn once per recording instead of per frame
+                    if frames_skipped == 0:
+                        logger.warning("Skipping empty frame during FFmpeg recording")
+                    frames_skipped += 1
                     continue
 
                 # Ensure contiguous buffer before writing to pipe
@@ -534,6 +568,8 @@ class Picamera2HighFpsCapture:
         finally:
             self.stop_ffmpeg_encoder()
 
+        if frames_skipped > 1:
+            logger.warning(f"Skipped {frames_skipped} empty frames during FFmpeg recording")
         elapsed = time.perf_counter() - start_time
         if elapsed > 0:
             actual_fps = frames_written / elapsed
@@ -29,11 +29,11 @@ _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PLAYERONE_SDK_FULL_PYTHON = os.path.join(_PROJECT_ROOT, "PlayerOne_Camera_SDK_Linux_V3.10.0", "python")
 
 # Mars 662M (and similar) supported resolutions
-PLAYERONE_SUPPORTED_RESOLUTIONS = [
+PLAYERONE_SUPPORTED_RESOLUTIONS: Tuple[Tuple[int, int], ...] = (
     (1936, 1100),
     (1920, 1080),
     (1280, 720),
-]
+)
 
 
 def get_playerone_sdk_python_path() -> Optional[str]:
@@ -9,13 +9,17 @@ Author: RoboCam-Suite
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Tuple
-from datetime import datetime
+from typing import Dict, Optional, Tuple
+from collections import deque
 import os
 import time
+from pathlib import Path
 import threading
+import concurrent.futures
+from dataclasses import dataclass
 import subprocess as sp
 import numpy as np
+import cv2
 import atexit
 
 # PIL.ImageTk required for Player One / external camera preview (convert frames to tkinter PhotoImage)
@@ -30,9 +34,14 @@ except ImportError as e:
         "  3. If it still fails, reinstall Python with 'tcl/tk and IDLE' checked."
     ) from e
 
+from picamera2 import MappedArray, Picamera2, Preview
+
+from robocam.camera_backend import detect_camera
 from robocam.capture_interface import CaptureManager
-from robocam.camera_preview import FPSTracker, start_best_preview
+from robocam.camera_preview import CountingFPSTracker, start_best_preview
+from robocam.config import get_config
 from robocam.logging_config import get_logger
+from robocam.playerone_camera import PlayerOneCamera
 from robocam.resolution_presets import (
     get_capture_resolution_presets,
     format_resolution_option,
@@ -42,6 +51,106 @@ from robocam.resolution_presets import (
 
 logger = get_logger(__name__)
 
+# Quick capture file extension per image format option
+_IMAGE_EXT = {"PNG": ".png", "JPEG": ".jpg"}
+
+
+@dataclass(frozen=True)
+class _CaptureParams:
+    """Resolution, frame rate and capture type read from the settings widgets in one go."""
+    res_x: int
+    res_y: int
+    fps: float
+    is_grayscale: bool
+
+
+def _safe_float(getter) -> Optional[float]:
+    """Return float(getter().strip()), or None if the value is missing or invalid."""
+    try:
+        return float(getter().strip())
+    except (ValueError, tk.TclError):
+        return None
+
+
+def _safe_tuple(getter) -> Optional[Tuple[int, int]]:
+    """Return getter() as a (width, height) tuple, or None if it cannot be read."""
+    try:
+        return tuple(getter())
+    except (ValueError, TypeError, tk.TclError):
+        return None
+
+
+_gl_hint_applied = False
+
+
+def _hint_low_latency_gl() -> None:
+    """
+    Ask Qt for single-buffered, vsync-off GL surfaces before a QTGL preview is created.
+
+    Double-buffered swaps with vsync add up to a frame of display latency, which is
+    not wanted for alignment/monitoring previews. Applied once, best-effort: the
+    default format only affects surfaces created afterwards and is ignored when Qt
+    is unavailable.
+    """
+    global _gl_hint_applied
+    if _gl_hint_applied:
+        return
+    _gl_hint_applied = True
+    try:
+        try:
+            from PyQt5.QtGui import QSurfaceFormat
+        except ImportError:
+            from PyQt6.QtGui import QSurfaceFormat
+        fmt = QSurfaceFormat.defaultFormat()
+        fmt.setSwapBehavior(QSurfaceFormat.SwapBehavior.SingleBuffer)
+        fmt.setSwapInterval(0)
+        QSurfaceFormat.setDefaultFormat(fmt)
+    except Exception as e:
+        logger.debug(f"Low-latency GL surface hint not applied: {e}")
+
+
+def _display_stream_size(res_x: int, res_y: int, max_w: int = 800, max_h: int = 600) -> Tuple[int, int]:
+    """
+    Size of the lores stream used for the native preview display.
+
+    Fits the main stream's aspect ratio inside max_w x max_h (never upscaling) and
+    rounds down to even dimensions as YUV420 requires.
+    """
+    scale = min(1.0, max_w / res_x, max_h / res_y)
+    return (max(2, int(res_x * scale) & ~1), max(2, int(res_y * scale) & ~1))
+
+
+def _decimate_for_canvas(frame: np.ndarray, canvas_width: int, canvas_height: int) -> np.ndarray:
+    """
+    Cheaply shrink a frame towards the canvas size by integer striding.
+
+    Returns a strided view (no copy) so the following filtered resize only touches
+    roughly canvas-sized input. Frames already near canvas size are returned as is.
+    """
+    if canvas_width <= 1 or canvas_height <= 1:
+        return frame
+    stride = min(frame.shape[0] // canvas_height, frame.shape[1] // canvas_width)
+    if stride > 1:
+        return frame[::stride, ::stride]
+    return frame
+
+
+def _pil_view(frame: np.ndarray) -> Image.Image:
+    """
+    Wrap an 8-bit grayscale or RGB frame as a PIL image without copying.
+
+    Contiguous uint8 frames are wrapped with Image.frombuffer, so the image shares
+    the array's memory. Strided views (e.g. from _decimate_for_canvas) and other
+    layouts fall back to Image.fromarray, which copies.
+    """
+    if frame.dtype == np.uint8 and frame.flags.c_contiguous:
+        height, width = frame.shape[:2]
+        if frame.ndim == 2:
+            return Image.frombuffer("L", (width, height), frame, "raw", "L", 0, 1)
+        if frame.ndim == 3 and frame.shape[2] == 3:
+            return Image.frombuffer("RGB", (width, height), frame, "raw", "RGB", 0, 1)
+    return Image.fromarray(frame)
+
 
 class PreviewWindow:
     """
@@ -58,6 +167,15 @@ class PreviewWindow:
         _native_preview_active (bool): Whether native preview is active
         _preview_backend (Optional[str]): Active preview backend name
     """
+
+    # Canvas size change (px) tolerated before the grayscale lores stream is reconfigured
+    LORES_HYSTERESIS_PX = 32
+    # Minimum interval (s) between preview FPS samples
+    FPS_SAMPLE_INTERVAL_S = 1.0
+    # Consecutive clean frames before a caller's post_callback is chained without try/except
+    CHAINED_CALLBACK_TRIAL_FRAMES = 30
+    # Quiet period (ms) after the last settings edit before the preview is updated
+    SETTINGS_DEBOUNCE_MS = 400
     
     def __init__(
         self,
@@ -68,6 +186,7 @@ class PreviewWindow:
         initial_fps: float = 30.0,
         simulate_cam: bool = False,
         usb_camera=None,
+        output_dir: str = "outputs",
     ):
         """
         Initialize preview window.
@@ -80,94 +199,76 @@ class PreviewWindow:
             initial_fps: Initial preview FPS
             simulate_cam: If True, run in camera simulation mode
             usb_camera: Optional camera instance (Player One). Used when Pi HQ is not present.
+            output_dir: Directory for quick captures (created once here, not per capture)
         """
         self.parent = parent
         self._simulate_cam = simulate_cam
         self._native_preview_active = False
         self._preview_backend: Optional[str] = None
+        # Last preview backend that started successfully (tried first on the next start)
+        self._last_good_backend: Optional[str] = None
+        # Pause after picam2.stop() before reconfiguring (see _quiesce_camera)
+        self._stop_settle_s = 0.05
+        try:
+            config = get_config()
+            cached_backend = config.get("hardware.camera.last_preview_backend")
+            if cached_backend in ("drm", "qtgl"):
+                self._last_good_backend = cached_backend
+            self._stop_settle_s = float(config.get("hardware.camera.stop_settle_s", 0.05))
+        except Exception as e:
+            logger.debug(f"Could not read cached preview backend: {e}")
+        self._native_preview_job: Optional[str] = None  # after() id of the next native preview start step
+        self._native_preview_seq = 0  # Bumped on stop so stale first-frame callbacks are ignored
         self._measuring_fps = False
+        self._picam2_started = False  # Set once this window has started picam2
+        # Size/FPS the preview configuration was last built with (FPS-only changes use set_controls)
+        self._current_size: Optional[Tuple[int, int]] = None
+        self._current_fps: Optional[float] = None
+        # (width, height, fps, kind) of the running preview configuration, kind being
+        # "plain", "native" (lores display) or "grayscale" (lores for the canvas);
+        # None while the camera is stopped or configured for something else
+        self._preview_config_key: Optional[Tuple[int, int, float, str]] = None
         self.usb_camera = usb_camera
         self._usb_preview_job: Optional[str] = None  # after() id for external camera preview loop
+        self._settings_after_id: Optional[str] = None  # after() id of the pending debounced settings update
+        self._gray_resized_buf: Optional[np.ndarray] = None  # Reused canvas-sized grayscale buffer
+        self._gray_resized_img: Optional[Image.Image] = None  # PIL view of _gray_resized_buf
 
-        # Use first camera found: Pi HQ or Player One (only one in system at a time)
+        self._initial_resolution = tuple(initial_resolution)
+        self._initial_fps = initial_fps
+
+        # Camera and capture manager passed in by the caller are used as-is; otherwise they
+        # are detected/created in _init_camera/_init_capture_manager once the window is up
+        self.picam2 = None if usb_camera is not None else picam2
         if usb_camera is not None:
-            self.picam2 = None
             logger.info("PreviewWindow: Using Player One camera")
-        elif picam2 is not None:
-            self.picam2 = picam2
-        elif not simulate_cam:
-            # No camera passed: detect and create (used by calibrate.py)
-            # detect_camera returns the Picamera2 instance for Pi HQ to avoid creating
-            # a second instance (which fails: "Camera in Configured state trying acquire()")
-            from robocam.camera_backend import detect_camera
-            backend = detect_camera()
-            if backend is not None and not isinstance(backend, tuple):
-                # Pi HQ: backend is the Picamera2 instance (stopped, ready to reconfigure)
-                self.picam2 = backend
-                self.picam2_config = self.picam2.create_preview_configuration(
-                    main={"size": initial_resolution},
-                    controls={"FrameRate": initial_fps},
-                    buffer_count=2
-                )
-                self.picam2.configure(self.picam2_config)
-                try:
-                    self.picam2.start()
-                    logger.info("PreviewWindow: Created and started Picamera2 instance")
-                except Exception as e:
-                    logger.error(f"PreviewWindow: Failed to start camera: {e}")
-                    self.picam2 = None
-            elif isinstance(backend, tuple) and backend[0] == "playerone":
-                from robocam.playerone_camera import PlayerOneCamera
-                po_index = backend[1]
-                self.usb_camera = PlayerOneCamera(
-                    resolution=initial_resolution,
-                    fps=initial_fps,
-                    camera_index=po_index
-                )
-                self.picam2 = None
-                logger.info("PreviewWindow: Created and started Player One camera instance (index %d)", po_index)
-            else:
-                self.picam2 = None
-                logger.warning("PreviewWindow: No camera found")
-        else:
-            self.picam2 = picam2
-
-        # Create capture manager if not provided
-        if capture_manager is None and not simulate_cam:
-            if self.usb_camera is not None:
-                try:
-                    self.capture_manager = CaptureManager(
-                        capture_type="Player One (Grayscale)",
-                        resolution=initial_resolution,
-                        fps=initial_fps,
-                        playerone_camera=self.usb_camera
-                    )
-                    logger.info("PreviewWindow: Created CaptureManager (Player One)")
-                except Exception as e:
-                    logger.warning(f"PreviewWindow: Failed to create capture manager: {e}")
-                    self.capture_manager = None
-            elif self.picam2 is not None:
-                try:
-                    self.capture_manager = CaptureManager(
-                        capture_type="Picamera2 (Color)",
-                        resolution=initial_resolution,
-                        fps=initial_fps,
-                        picam2=self.picam2
-                    )
-                    logger.info("PreviewWindow: Created CaptureManager")
-                except Exception as e:
-                    logger.warning(f"PreviewWindow: Failed to create capture manager: {e}")
-                    self.capture_manager = None
-            else:
-                self.capture_manager = None
-        else:
-            self.capture_manager = capture_manager
+        self.capture_manager = capture_manager
+        self._capture_mgr_owned = False  # True only when this window created the capture manager
+        self._bind_capture_type = capture_manager is not None  # Capture type changes only apply to a caller's manager
         
         self._recording: bool = False
-        self.fps_tracker: Optional[FPSTracker] = None
-        self._running: bool = True
+        self._recording_ui_state = False  # Recording look currently shown on the Quick Capture button
+        self._fps_tracking = False  # True when a camera is available for live FPS display
+        # Counts delivered preview frames; the label samples it every FPS_SAMPLE_INTERVAL_S
+        self._fps_tracker = CountingFPSTracker(min_interval=self.FPS_SAMPLE_INTERVAL_S)
+        self._fps_callback = self._fps_tracker.on_frame  # post_callback installed for FPS tracking
+        self._last_fps_text: Optional[str] = None  # Text currently shown in fps_label
+        self._fps_update_job: Optional[str] = None  # after() id of the next FPS label update
+        # Cleared on close; shared by the Tk thread, camera callbacks and worker threads
+        self._running = threading.Event()
+        self._running.set()
+        self._closed = False  # Set by the first on_close(); later calls return immediately
         self._fps_checked = False  # Track if FPS has been checked
         self._measured_fps: Optional[float] = None  # Store measured FPS value
+        # Single worker for FPS measurement so runs never overlap and no thread is spawned per click
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="FpsMeasure")
+        self._outputs_dir = Path(output_dir)  # Quick capture output directory
+        try:
+            self._outputs_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not create output directory {self._outputs_dir}: {e}")
+        self._last_capture_stamp = ""  # Timestamp of the last quick capture name
+        self._capture_stamp_seq = 0  # Captures already named within that second
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -201,10 +302,25 @@ class PreviewWindow:
             width=min(initial_resolution[0], 400),
             height=min(initial_resolution[1], 300),
             bg="black",
-            highlightthickness=1,
-            highlightbackground="gray"
+            highlightthickness=0  # No focus border to repaint around every frame
         )
         self.grayscale_image_id = None
+        self._image_center: Optional[Tuple[int, int]] = None  # Last coords of grayscale_image_id
+        # Canvas size cached from <Configure> (1x1 until mapped, like winfo_width/height)
+        self._canvas_w = 1
+        self._canvas_h = 1
+        self.grayscale_canvas.bind("<Configure>", self._on_canvas_resize)
+        # Grayscale preview worker: latest-wins request/result hand-off with the Tk thread
+        self._gray_requests: deque = deque(maxlen=1)
+        self._gray_results: deque = deque(maxlen=1)
+        self._gray_request_evt = threading.Event()
+        self._gray_worker: Optional[threading.Thread] = None
+        # Serializes picam2 configure/start/stop with frame grabs across threads: held by the
+        # grayscale worker for one frame, by the Tk thread while it reconfigures the camera
+        # and by the FPS measurement for as long as it owns the camera
+        self._camera_lock = threading.Lock()
+        # PhotoImages reused across frames, keyed by image size (most recent last)
+        self._tk_photo_pool: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
         # Canvas is hidden by default, only shown for grayscale captured images
         
         # Capture Type (Player One backend shows only Player One type)
@@ -216,20 +332,19 @@ class PreviewWindow:
             capture_types = CaptureManager.CAPTURE_TYPES
             default_type = "Picamera2 (Color)"
         self.capture_type_var = tk.StringVar(value=default_type)
-        if capture_manager:
-            capture_type_menu = tk.OptionMenu(
-                settings_frame,
-                self.capture_type_var,
-                *capture_types,
-                command=self.on_capture_type_change
-            )
-        else:
-            capture_type_menu = tk.OptionMenu(
-                settings_frame,
-                self.capture_type_var,
-                *capture_types
+        self.capture_type_menu = ttk.Combobox(
+            settings_frame,
+            textvariable=self.capture_type_var,
+            values=tuple(capture_types),
+            state="readonly",
+            width=22
+        )
+        if self._bind_capture_type:
+            self.capture_type_menu.bind(
+                "<<ComboboxSelected>>",
+                lambda _: self.on_capture_type_change(self.capture_type_var.get())
             )
-        capture_type_menu.grid(row=0, column=1, sticky="w", padx=2, pady=2)
+        self.capture_type_menu.grid(row=0, column=1, sticky="w", padx=2, pady=2)
         
         # Resolution (native presets only)
         is_pihq = self.usb_camera is None
@@ -239,13 +354,15 @@ class PreviewWindow:
         initial_opt = resolution_to_preset_option(initial_resolution, self._resolution_presets)
         self.resolution_var = tk.StringVar(value=initial_opt)
         tk.Label(settings_frame, text="Resolution:").grid(row=1, column=0, sticky="w", padx=2, pady=2)
-        resolution_menu = tk.OptionMenu(
+        self.resolution_menu = ttk.Combobox(
             settings_frame,
-            self.resolution_var,
-            *self._resolution_options,
-            command=lambda _: self.on_settings_change()
+            textvariable=self.resolution_var,
+            values=tuple(self._resolution_options),
+            state="readonly",
+            width=22
         )
-        resolution_menu.grid(row=1, column=1, sticky="w", padx=2, pady=2)
+        self.resolution_menu.bind("<<ComboboxSelected>>", lambda _: self.on_settings_change())
+        self.resolution_menu.grid(row=1, column=1, sticky="w", padx=2, pady=2)
         
         # FPS
         tk.Label(settings_frame, text="Target FPS:").grid(row=2, column=0, sticky="w", padx=2, pady=2)
@@ -257,13 +374,17 @@ class PreviewWindow:
         # Capture Mode
         tk.Label(settings_frame, text="Mode:").grid(row=3, column=0, sticky="w", padx=2, pady=2)
         self.capture_mode_var = tk.StringVar(value="Image")
-        capture_mode_menu = tk.OptionMenu(settings_frame, self.capture_mode_var, "Image", "Video")
+        capture_mode_menu = ttk.Combobox(
+            settings_frame, textvariable=self.capture_mode_var, values=("Image", "Video"), state="readonly", width=10
+        )
         capture_mode_menu.grid(row=3, column=1, sticky="w", padx=2, pady=2)
         
         # Image Format (only for Image mode)
         tk.Label(settings_frame, text="Format:").grid(row=4, column=0, sticky="w", padx=2, pady=2)
         self.image_format_var = tk.StringVar(value="PNG")
-        format_menu = tk.OptionMenu(settings_frame, self.image_format_var, "PNG", "JPEG")
+        format_menu = ttk.Combobox(
+            settings_frame, textvariable=self.image_format_var, values=("PNG", "JPEG"), state="readonly", width=10
+        )
         format_menu.grid(row=4, column=1, sticky="w", padx=2, pady=2)
         
         # Quick Capture Button
@@ -303,23 +424,112 @@ class PreviewWindow:
         )
         self.status_label.grid(row=9, column=0, columnspan=2, padx=2, pady=5, sticky="w")
         
+        # Camera detection and capture manager creation can take a second or more on a Pi;
+        # run them after the window is shown so the parent UI does not freeze
+        if self.picam2 is None and self.usb_camera is None and not simulate_cam:
+            self.status_label.config(text="Initializing camera...", fg="blue")
+        self.window.after_idle(self._init_camera)
+    
+    def _init_camera(self) -> None:
+        """
+        Detect and start the camera when none was passed in (used by calibrate.py).
+
+        Runs from after_idle so the window is displayed first, then chains
+        _init_capture_manager.
+        """
+        if not self._running.is_set():
+            return
+        if self.picam2 is None and self.usb_camera is None and not self._simulate_cam:
+            # detect_camera returns the Picamera2 instance for Pi HQ to avoid creating
+            # a second instance (which fails: "Camera in Configured state trying acquire()")
+            initial_resolution = self._initial_resolution
+            initial_fps = self._initial_fps
+            backend = detect_camera()
+            if backend is not None and not isinstance(backend, tuple):
+                # Pi HQ: backend is the Picamera2 instance (stopped, ready to reconfigure)
+                self.picam2 = backend
+                self.picam2_config = self.picam2.create_preview_configuration(
+                    main={"size": initial_resolution},
+                    controls={"FrameRate": initial_fps},
+                    buffer_count=4  # Extra buffers so Tk-side stalls do not drop frames
+                )
+                self.picam2.configure(self.picam2_config)
+                try:
+                    self.picam2.start()
+                    self._picam2_started = True
+                    self._current_size = tuple(initial_resolution)
+                    self._current_fps = initial_fps
+                    self._preview_config_key = (*self._current_size, initial_fps, "plain")
+                    logger.info("PreviewWindow: Created and started Picamera2 instance")
+                except Exception as e:
+                    logger.error(f"PreviewWindow: Failed to start camera: {e}")
+                    self.picam2 = None
+            elif isinstance(backend, tuple) and backend[0] == "playerone":
+                po_index = backend[1]
+                self.usb_camera = PlayerOneCamera(
+                    resolution=initial_resolution,
+                    fps=initial_fps,
+                    camera_index=po_index
+                )
+                logger.info("PreviewWindow: Created and started Player One camera instance (index %d)", po_index)
+                self._refresh_backend_options()
+            else:
+                logger.warning("PreviewWindow: No camera found")
+        self.window.after_idle(self._init_capture_manager)
+    
+    def _init_capture_manager(self) -> None:
+        """Create the capture manager if none was passed in, then start FPS display and preview."""
+        if not self._running.is_set():
+            return
+        if self.capture_manager is None and not self._simulate_cam:
+            if self.usb_camera is not None:
+                try:
+                    self.capture_manager = CaptureManager(
+                        capture_type="Player One (Grayscale)",
+                        resolution=self._initial_resolution,
+                        fps=self._initial_fps,
+                        playerone_camera=self.usb_camera
+                    )
+                    self._capture_mgr_owned = True
+                    logger.info("PreviewWindow: Created CaptureManager (Player One)")
+                except Exception as e:
+                    logger.warning(f"PreviewWindow: Failed to create capture manager: {e}")
+                    self.capture_manager = None
+            elif self.picam2 is not None:
+                try:
+                    self.capture_manager = CaptureManager(
+                        capture_type="Picamera2 (Color)",
+                        resolution=self._initial_resolution,
+                        fps=self._initial_fps,
+                        picam2=self.picam2
+                    )
+                    self._capture_mgr_owned = True
+                    logger.info("PreviewWindow: Created CaptureManager")
+                except Exception as e:
+                    logger.warning(f"PreviewWindow: Failed to create capture manager: {e}")
+                    self.capture_manager = None
+        
+        if self.status_label.cget("text") == "Initializing camera...":
+            if self.picam2 is None and self.usb_camera is None:
+                self.status_label.config(text="No camera found", fg="red")
+            else:
+                self.status_label.config(text="Ready", fg="gray")
+        
         # Initialize FPS tracking if camera is available (Pi HQ or Player One)
         if (self.picam2 is not None or self.usb_camera is not None) and not self._simulate_cam:
-            self.fps_tracker = FPSTracker()
+            self._fps_tracking = True
             if self.picam2 is not None:
                 # Set up frame callback for FPS tracking (Pi HQ)
-                def frame_callback(request):
-                    if self.fps_tracker:
-                        self.fps_tracker.update()
-                self.picam2.post_callback = frame_callback
+                self._install_fps_callback()
         
         # Defer preview start to allow window to fully initialize
         # This prevents issues with preview backends that need a fully rendered window
         # Preview will start after FPS check if user clicks "Measure FPS", otherwise starts normally
         def start_preview_after_init():
             """Start preview after window is fully initialized."""
+            if not self._running.is_set():
+                return
             self.window.update_idletasks()  # Ensure window is rendered
-            time.sleep(0.1)  # Brief additional wait
             # Only auto-start if FPS hasn't been checked yet
             # If FPS check happens, preview will start after measurement completes
             if not self._fps_checked:
@@ -332,17 +542,96 @@ class PreviewWindow:
         # Start FPS update loop
         self.update_fps()
     
-    def update_fps(self) -> None:
-        """Update FPS display from fps_tracker."""
-        if self.fps_tracker is not None:
-            fps = self.fps_tracker.get_fps()
-            self.fps_label.config(text=f"{fps:.1f}")
+    def _refresh_backend_options(self) -> None:
+        """Repopulate capture type and resolution menus after the camera backend changed."""
+        if self.usb_camera is not None:
+            capture_types = CaptureManager.CAPTURE_TYPES_PLAYERONE
+            self.capture_type_var.set("Player One (Grayscale)")
+        else:
+            capture_types = CaptureManager.CAPTURE_TYPES
+            self.capture_type_var.set("Picamera2 (Color)")
+        self.capture_type_menu["values"] = tuple(capture_types)
+        
+        is_pihq = self.usb_camera is None
+        is_playerone = self.usb_camera is not None and type(self.usb_camera).__name__ == "PlayerOneCamera"
+        self._resolution_presets = get_capture_resolution_presets(is_pihq, is_playerone)
+        self._resolution_options = [format_resolution_option(w, h) for w, h in self._resolution_presets]
+        self.resolution_var.set(resolution_to_preset_option(self._initial_resolution, self._resolution_presets))
+        self.resolution_menu["values"] = tuple(self._resolution_options)
+    
+    def _install_fps_callback(self) -> None:
+        """
+        Install the frame-count post_callback, keeping any callback the caller set.
+
+        Built once here so the per-frame path has no lookups or branches for it: the
+        tracker's bound counter method directly when there is nothing to chain,
+        otherwise a closure over the caller's callback. The caller's callback is
+        guarded with try/except until it has run CHAINED_CALLBACK_TRIAL_FRAMES frames
+        in a row without raising; after that a bare chain replaces the guarded one.
+        """
+        existing = self.picam2.post_callback
+        if existing is None or existing is self._fps_callback:
+            self._fps_callback = self._fps_tracker.on_frame
         else:
-            self.fps_label.config(text="0.0")
+            count_frame = self._fps_tracker.on_frame
+            picam2 = self.picam2
+            clean_frames = 0
+
+            def chained_callback(request):
+                existing(request)
+                count_frame(request)
+
+            def guarded_callback(request):
+                nonlocal clean_frames
+                try:
+                    existing(request)
+                except Exception as e:
+                    clean_frames = 0
+                    logger.debug(f"Chained post_callback failed: {e}")
+                else:
+                    clean_frames += 1
+                    if clean_frames >= self.CHAINED_CALLBACK_TRIAL_FRAMES and picam2.post_callback is guarded_callback:
+                        self._fps_callback = chained_callback
+                        picam2.post_callback = chained_callback
+                count_frame(request)
+
+            self._fps_callback = guarded_callback
+        self.picam2.post_callback = self._fps_callback
+    
+    def update_fps(self) -> None:
+        """
+        Update FPS display by sampling the frame counter.
+        
+        The camera thread only increments a counter; the rate is computed here from
+        the counter difference over at least FPS_SAMPLE_INTERVAL_S. The label is left
+        alone while the window is minimized or withdrawn (the loop keeps running).
+        """
+        self._fps_update_job = None
+        if self.window.winfo_viewable():
+            if self._fps_tracking:
+                text = f"{self._fps_tracker.get_fps():.1f}"
+            else:
+                text = "0.0"
+            # Skip the Tcl round-trip when the displayed value is unchanged
+            if text != self._last_fps_text:
+                self.fps_label.config(text=text)
+                self._last_fps_text = text
         
-        # Schedule next update (every 200ms = 5 Hz update rate)
-        if self._running:
-            self.window.after(200, self.update_fps)
+        # Schedule next update (every 200ms = 5 Hz) only while frames are flowing;
+        # _ensure_fps_updates() restarts the loop when a preview or measurement starts
+        if self._running.is_set() and (
+            self._native_preview_active or self._usb_preview_job is not None or self._measuring_fps
+        ):
+            self._fps_update_job = self.window.after(200, self._queue_fps_update)
+    
+    def _queue_fps_update(self) -> None:
+        """Timer tick: run update_fps once pending input/redraw events are handled."""
+        self._fps_update_job = self.window.after_idle(self.update_fps)
+    
+    def _ensure_fps_updates(self) -> None:
+        """Start the FPS label update loop if it is not already scheduled."""
+        if self._fps_update_job is None and self._running.is_set():
+            self._fps_update_job = self.window.after(200, self._queue_fps_update)
     
     def on_capture_type_change(self, capture_type: str) -> None:
         """Handle capture type change."""
@@ -359,6 +648,19 @@ class PreviewWindow:
                 self.status_label.config(text=f"Error: {e}", fg="red")
                 logger.error(f"Error changing capture type: {e}")
     
+    def get_camera_handles(self) -> Tuple[Optional[Picamera2], Optional[CaptureManager]]:
+        """
+        Return the (picam2, capture_manager) this window is currently using.
+
+        When none were passed in, both are created from after_idle once the window is
+        shown, so they are None right after construction. Call this when the handles
+        are needed (e.g. at close) instead of caching them after creating the window.
+
+        Returns:
+            Tuple of (Picamera2 instance or None, CaptureManager or None)
+        """
+        return self.picam2, self.capture_manager
+    
     def get_resolution(self) -> Tuple[int, int]:
         """Return current capture resolution (width, height) from preset dropdown."""
         parsed = parse_resolution_option(self.resolution_var.get())
@@ -369,14 +671,64 @@ class PreviewWindow:
         return (800, 600)
 
     def on_settings_change(self, event=None) -> None:
-        """Handle settings change (resolution, FPS)."""
-        # Update preview when settings change
+        """
+        Handle settings change (resolution, FPS).
+
+        Debounced: each change restarts a SETTINGS_DEBOUNCE_MS timer, so typing
+        "120" in the FPS entry updates the preview once instead of per keystroke.
+        """
+        if self._settings_after_id is not None:
+            self.window.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.window.after(self.SETTINGS_DEBOUNCE_MS, self._apply_settings_change)
+    
+    def _parse_cap_params(self, default_fps: float = 30.0) -> _CaptureParams:
+        """
+        Read resolution, target FPS and capture type from the widgets once (Tk thread only).
+
+        Args:
+            default_fps: FPS to use when the entry does not hold a valid number
+
+        Returns:
+            Snapshot to pass to code that must not read Tk variables itself
+        """
+        res_x, res_y = self.get_resolution()
+        fps = _safe_float(self.fps_var.get)
+        is_grayscale = "Grayscale" in self.capture_type_var.get()
+        return _CaptureParams(res_x, res_y, default_fps if fps is None else fps, is_grayscale)
+    
+    def _apply_settings_change(self) -> None:
+        """
+        Debounced settings handler: update preview for the settled values.
+
+        When the Pi HQ preview is running at the requested resolution, an FPS change
+        is applied in place with set_controls; the preview is only rebuilt when the
+        resolution changed or nothing is running yet.
+        """
+        self._settings_after_id = None
+        if not self._running.is_set() or self._measuring_fps:
+            # Settings are re-read when the preview restarts after the measurement
+            return
+        if (
+            self.picam2 is not None
+            and self.usb_camera is None
+            and not self._simulate_cam
+            and self._preview_config_key is not None
+            and (self._native_preview_active or self._preview_config_key[3] == "grayscale")
+        ):
+            params = self._parse_cap_params()
+            if (params.res_x, params.res_y) == self._current_size:
+                if params.fps != self._current_fps:
+                    self._apply_frame_rate(params.fps)
+                return
         self.update_preview()
     
     def update_preview(self) -> None:
         """Update preview based on current settings and capture type."""
         if (self.picam2 is None and self.usb_camera is None) or self._simulate_cam:
             return
+        if self._measuring_fps:
+            # The measurement owns the camera; it restarts the preview when done
+            return
 
         try:
             if self.usb_camera is not None:
@@ -404,18 +756,26 @@ class PreviewWindow:
             self.status_label.config(text=f"Preview error: {e}", fg="red")
     
     def _start_native_preview(self) -> None:
-        """Start native hardware-accelerated preview."""
-        if self._native_preview_active or self.picam2 is None:
+        """
+        Start native hardware-accelerated preview.
+
+        Runs as a chain of window.after() steps (stop -> configure/start -> show)
+        so the Tk event loop keeps running while the camera restarts. Pending steps
+        are cancelled by _stop_native_preview().
+        """
+        if self.picam2 is None or self._native_preview_job is not None:
             return
         
         try:
             # Get current resolution and FPS
-            try:
-                res_x, res_y = self.get_resolution()
-                fps = float(self.fps_var.get().strip())
-            except ValueError:
-                res_x, res_y = self.get_resolution()
-                fps = 30.0
+            params = self._parse_cap_params()
+            res_x, res_y, fps = params.res_x, params.res_y, params.fps
+            
+            if self._native_preview_active:
+                # Preview already running: FPS-only changes apply live without reconfiguring
+                if (res_x, res_y) == self._current_size and fps != self._current_fps:
+                    self._apply_frame_rate(fps)
+                return
             
             # Check if camera is already started and configured
             camera_ready = False
@@ -429,43 +789,88 @@ class PreviewWindow:
                         main_config = current_config.get('main', {})
                         current_size = main_config.get('size')
                         if current_size == (res_x, res_y):
-                            # Same resolution, camera is ready
+                            # Same resolution, camera is ready; FPS is a runtime control
                             camera_ready = True
                             logger.info("Camera already configured correctly, skipping reconfiguration")
+                            if fps != self._current_fps:
+                                self._apply_frame_rate(fps)
                 except:
                     pass
             
-            # Only reconfigure if needed
-            if not camera_ready:
-                # Stop camera if running
-                try:
+            if camera_ready:
+                self._native_preview_job = self.window.after(0, self._native_preview_show)
+                return
+            
+            # Stop camera if running, then configure on the next event loop turn
+            try:
+                with self._camera_lock:
                     if hasattr(self.picam2, 'started') and self.picam2.started:
                         self.picam2.stop()
-                        time.sleep(0.1)  # Brief pause after stopping
-                except Exception as e:
-                    logger.warning(f"Error stopping camera: {e}")
-                
-                # Configure and start camera
-                try:
-                    self.picam2_config = self.picam2.create_preview_configuration(
-                        main={"size": (res_x, res_y)},
-                        controls={"FrameRate": fps},
-                        buffer_count=2
-                    )
-                    self.picam2.configure(self.picam2_config)
-                    self.picam2.start()
-                    logger.info(f"Camera configured: {res_x}x{res_y} @ {fps} FPS")
-                except Exception as e:
-                    logger.error(f"Failed to configure camera: {e}")
-                    self.preview_info_label.config(
-                        text=f"✗ Camera configuration error: {str(e)[:60]}...",
-                        fg="red"
-                    )
-                    return
-                
-                # Give camera time to fully start before attempting preview
-                time.sleep(0.2)  # Increased wait time for camera initialization
-            
+            except Exception as e:
+                logger.warning(f"Error stopping camera: {e}")
+            self._native_preview_job = self.window.after(
+                0, self._native_preview_configure, res_x, res_y, fps
+            )
+        except Exception as e:
+            self._native_preview_job = None
+            logger.error(f"Error starting native preview: {e}")
+            self.preview_info_label.config(
+                text=f"✗ Preview error: {str(e)[:60]}...",
+                fg="red"
+            )
+    
+    def _apply_frame_rate(self, fps: float) -> None:
+        """Change the running camera's frame rate via controls (no stop/configure/start)."""
+        try:
+            self.picam2.set_controls({"FrameRate": fps})
+            self._current_fps = fps
+            if self._preview_config_key is not None:
+                self._preview_config_key = (*self._preview_config_key[:2], fps, self._preview_config_key[3])
+            logger.info(f"Frame rate set to {fps} FPS")
+        except Exception as e:
+            logger.warning(f"Could not set frame rate to {fps}: {e}")
+    
+    def _native_preview_configure(self, res_x: int, res_y: int, fps: float) -> None:
+        """Native preview step: configure and start the camera, then show once a frame arrives."""
+        self._native_preview_job = None
+        if self.picam2 is None or not self._running.is_set():
+            return
+        try:
+            # Native preview renders a small YUV420 lores stream scaled by the ISP;
+            # captures keep using the full-size main stream
+            self.picam2_config = self.picam2.create_preview_configuration(
+                main={"size": (res_x, res_y)},
+                lores={"size": _display_stream_size(res_x, res_y), "format": "YUV420"},
+                display="lores",
+                controls={"FrameRate": fps},
+                buffer_count=4  # Extra buffers so Tk-side stalls do not drop frames
+            )
+            with self._camera_lock:
+                self.picam2.configure(self.picam2_config)
+                self.picam2.start()
+            self._picam2_started = True
+            self._current_size = (res_x, res_y)
+            self._current_fps = fps
+            self._preview_config_key = (res_x, res_y, fps, "native")
+            logger.info(f"Camera configured: {res_x}x{res_y} @ {fps} FPS")
+        except Exception as e:
+            logger.error(f"Failed to configure camera: {e}")
+            self.preview_info_label.config(
+                text=f"✗ Camera configuration error: {str(e)[:60]}...",
+                fg="red"
+            )
+            return
+        
+        # Continue when the first frame arrives instead of after a fixed start-up delay
+        self._after_first_frame(self._native_preview_show)
+    
+    def _native_preview_show(self) -> None:
+        """Native preview step: open the preview window on the running camera."""
+        self._native_preview_job = None
+        if self._native_preview_active or self.picam2 is None or not self._running.is_set():
+            return
+        
+        try:
             # Stop any existing preview first (in case preview was already started)
             try:
                 if hasattr(self.picam2, '_preview'):
@@ -473,7 +878,6 @@ class PreviewWindow:
                     if self.picam2._preview is not None:
                         logger.info("Stopping existing preview before starting new one...")
                         self.picam2.stop_preview()
-                        time.sleep(0.1)
             except Exception as e:
                 logger.debug(f"Error checking for existing preview (likely none): {e}")
             
@@ -483,7 +887,7 @@ class PreviewWindow:
                 logger.warning("Camera not started, attempting to start...")
                 try:
                     self.picam2.start()
-                    time.sleep(0.2)  # Give it more time to initialize
+                    self._picam2_started = True
                 except Exception as e:
                     logger.error(f"Failed to start camera: {e}")
                     self.preview_info_label.config(
@@ -491,13 +895,16 @@ class PreviewWindow:
                         fg="red"
                     )
                     return
+                self._after_first_frame(self._native_preview_show)
+                return
             
             # Start native preview using the smart backend selection function
             # This function automatically detects desktop session and picks the best backend
             error_details = []
             try:
-                self._preview_backend = start_best_preview(self.picam2, backend="auto")
+                self._preview_backend = self._start_preview_backend()
                 self._native_preview_active = True
+                self._ensure_fps_updates()
                 self.preview_info_label.config(
                     text=f"✓ Native preview active in separate window (Backend: {self._preview_backend.upper()})",
                     fg="green"
@@ -509,7 +916,6 @@ class PreviewWindow:
                 logger.warning(f"start_best_preview failed: {error_msg}")
                 
                 # Try each backend individually with better error messages
-                from picamera2 import Preview
                 backends_to_try = [
                     ("DRM", Preview.DRM),
                     ("QTGL", Preview.QTGL),
@@ -524,7 +930,10 @@ class PreviewWindow:
                         logger.info(f"Trying {backend_name} backend...")
                         self.picam2.start_preview(backend_type)
                         self._preview_backend = backend_name.lower()
+                        if backend_name != "NULL":
+                            self._remember_preview_backend(self._preview_backend)
                         self._native_preview_active = True
+                        self._ensure_fps_updates()
                         preview_started = True
                         logger.info(f"Successfully started {backend_name} preview")
                         
@@ -569,10 +978,97 @@ class PreviewWindow:
                 text=f"✗ Preview error: {str(e)[:60]}...",
                 fg="red"
             )
-    
-    def _stop_native_preview(self) -> None:
-        """Stop native preview."""
-        if not self._native_preview_active:
+
+    def _start_preview_backend(self) -> str:
+        """
+        Start the native preview, trying the last backend that worked first.
+
+        The cached backend (persisted as hardware.camera.last_preview_backend) skips
+        the auto-selection order on later starts; if it fails, auto-selection runs.
+
+        Returns:
+            Name of the backend that was started
+
+        Raises:
+            RuntimeError: If all backends fail to start
+        """
+        _hint_low_latency_gl()
+        cached = self._last_good_backend
+        if cached:
+            try:
+                return start_best_preview(self.picam2, backend=cached)
+            except (RuntimeError, ValueError) as e:
+                logger.info(f"Cached preview backend '{cached}' failed ({e}), trying auto-selection")
+                self._last_good_backend = None
+        backend = start_best_preview(self.picam2, backend="auto")
+        self._remember_preview_backend(backend)
+        return backend
+    
+    def _remember_preview_backend(self, backend: str) -> None:
+        """Cache a working preview backend and persist it (off the UI thread) when it changes."""
+        if backend == self._last_good_backend:
+            return
+        self._last_good_backend = backend
+        threading.Thread(
+            target=self._persist,
+            args=({"hardware.camera.last_preview_backend": backend},),
+            daemon=True
+        ).start()
+    
+    def _after_first_frame(self, callback, timeout_ms: int = 1000) -> None:
+        """
+        Run callback on the Tk thread once the started camera delivers a frame.
+
+        capture_metadata() completes with the first frame's metadata, a precise
+        readiness signal compared to sleeping for a guessed warm-up time. If no
+        frame arrives within timeout_ms the callback runs anyway. The pending step
+        is tracked in _native_preview_job so _stop_native_preview() can cancel it.
+
+        Args:
+            callback: Zero-argument callable to run
+            timeout_ms: Maximum milliseconds to wait for a frame
+        """
+        seq = self._native_preview_seq
+        fired = threading.Event()
+
+        def proceed():
+            if fired.is_set() or seq != self._native_preview_seq:
+                return
+            fired.set()
+            if self._native_preview_job is not None:
+                try:
+                    self.window.after_cancel(self._native_preview_job)
+                except Exception:
+                    pass
+                self._native_preview_job = None
+            callback()
+
+        def on_frame(job):
+            # Called from the camera thread; hop back to the Tk thread
+            if not fired.is_set():
+                try:
+                    self.window.after(0, proceed)
+                except Exception:
+                    pass
+
+        self._native_preview_job = self.window.after(timeout_ms, proceed)
+        try:
+            self.picam2.capture_metadata(signal_function=on_frame)
+        except Exception as e:
+            logger.debug(f"Waiting for first frame failed, using timeout: {e}")
+    
+    def _stop_native_preview(self) -> None:
+        """Stop native preview (and cancel a start that is still in progress)."""
+        # Invalidate pending first-frame callbacks and cancel the next scheduled step
+        self._native_preview_seq += 1
+        if self._native_preview_job is not None:
+            try:
+                self.window.after_cancel(self._native_preview_job)
+            except Exception:
+                pass
+            self._native_preview_job = None
+
+        if not self._native_preview_active:
             return
 
         try:
@@ -596,36 +1092,29 @@ class PreviewWindow:
 
     def _usb_preview_loop(self) -> None:
         """Read one frame from Player One / external camera and display in canvas; schedule next."""
-        if not self._running or self.usb_camera is None or self.usb_camera.cap is None or not self.usb_camera.cap.isOpened():
+        if not self._running.is_set() or self.usb_camera is None or self.usb_camera.cap is None or not self.usb_camera.cap.isOpened():
             self._usb_preview_job = None
             return
         try:
             frame = self.usb_camera.read_frame()
             if frame is not None and self.grayscale_canvas.winfo_exists():
-                if self.fps_tracker:
-                    self.fps_tracker.update()
-                if frame.ndim == 2:
-                    pil_image = Image.fromarray(frame, mode="L")
+                self._fps_tracker.update()
+                cw = self._canvas_w
+                ch = self._canvas_h
+                frame = _decimate_for_canvas(frame, cw, ch)
+                if frame.ndim == 2 and cw > 1 and ch > 1:
+                    pil_image = self._resize_gray_to_canvas(frame, cw, ch)
                 else:
-                    import cv2
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    pil_image = Image.fromarray(frame_rgb)
-                cw = self.grayscale_canvas.winfo_width()
-                ch = self.grayscale_canvas.winfo_height()
-                if cw > 1 and ch > 1:
-                    pil_image = pil_image.resize((cw, ch), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image=pil_image)
-                if self.grayscale_image_id is None:
-                    self.grayscale_image_id = self.grayscale_canvas.create_image(
-                        cw // 2, ch // 2, image=photo, anchor="center"
-                    )
-                else:
-                    self.grayscale_canvas.itemconfig(self.grayscale_image_id, image=photo)
-                    self.grayscale_canvas.coords(self.grayscale_image_id, cw // 2, ch // 2)
-                self.grayscale_canvas.photo = photo
+                    if frame.ndim == 2:
+                        pil_image = _pil_view(frame)
+                    else:
+                        pil_image = _pil_view(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                    if cw > 1 and ch > 1:
+                        pil_image = pil_image.resize((cw, ch), Image.Resampling.BILINEAR)
+                self._display_on_canvas(pil_image, cw, ch)
         except Exception as e:
             logger.debug(f"External camera preview frame error: {e}")
-        if self._running and self.usb_camera is not None:
+        if self._running.is_set() and self.usb_camera is not None:
             self._usb_preview_job = self.window.after(33, self._usb_preview_loop)
 
     def _start_usb_preview(self) -> None:
@@ -635,6 +1124,7 @@ class PreviewWindow:
             return
         self.preview_info_label.config(text="Player One camera live preview", fg="green")
         self._usb_preview_job = self.window.after(50, self._usb_preview_loop)
+        self._ensure_fps_updates()
 
     def _show_grayscale_preview(self) -> None:
         """Show captured grayscale image preview."""
@@ -642,113 +1132,353 @@ class PreviewWindow:
             try:
                 frame = self.usb_camera.read_frame()
                 if frame is not None:
-                    if frame.ndim == 2:
-                        pil_image = Image.fromarray(frame, mode="L")
+                    canvas_width = self._canvas_w
+                    canvas_height = self._canvas_h
+                    frame = _decimate_for_canvas(frame, canvas_width, canvas_height)
+                    if frame.ndim == 2 and canvas_width > 1 and canvas_height > 1:
+                        pil_image = self._resize_gray_to_canvas(frame, canvas_width, canvas_height)
                     else:
-                        import cv2
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        pil_image = Image.fromarray(frame_rgb)
-                    canvas_width = self.grayscale_canvas.winfo_width()
-                    canvas_height = self.grayscale_canvas.winfo_height()
-                    if canvas_width > 1 and canvas_height > 1:
-                        pil_image = pil_image.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image=pil_image)
+                        if frame.ndim == 2:
+                            pil_image = _pil_view(frame)
+                        else:
+                            pil_image = _pil_view(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                        if canvas_width > 1 and canvas_height > 1:
+                            pil_image = pil_image.resize((canvas_width, canvas_height), Image.Resampling.BILINEAR)
                     self.grayscale_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-                    if self.grayscale_image_id is None:
-                        self.grayscale_image_id = self.grayscale_canvas.create_image(
-                            canvas_width // 2, canvas_height // 2, image=photo, anchor="center"
-                        )
-                    else:
-                        self.grayscale_canvas.itemconfig(self.grayscale_image_id, image=photo)
-                        self.grayscale_canvas.coords(
-                            self.grayscale_image_id, canvas_width // 2, canvas_height // 2
-                        )
-                    self.grayscale_canvas.photo = photo
+                    self._display_on_canvas(pil_image, canvas_width, canvas_height)
                     self.preview_info_label.config(
                         text="✓ Grayscale preview (captured image shown below)", fg="blue"
                     )
             except Exception as e:
                 logger.error(f"Error showing Player One grayscale preview: {e}")
             return
-        if self.picam2 is None:
+        if self.picam2 is None or self._measuring_fps:
             return
         
-        try:
-            # Ensure camera is running
+        # Camera (re)configuration stays here on the Tk thread; the grayscale worker only
+        # grabs and converts frames. Keep only the latest request
+        params = self._parse_cap_params()
+        canvas_width, canvas_height = self._canvas_w, self._canvas_h
+        with self._camera_lock:
             try:
                 if hasattr(self.picam2, 'started') and not self.picam2.started:
                     self.picam2.start()
-            except:
-                pass
-            
-            # Capture a frame from picam2
-            import numpy as np
-            array = self.picam2.capture_array("main")
-            
-            # Convert to grayscale
-            if array.ndim == 3 and array.shape[2] == 3:
-                # RGB - convert to grayscale
-                gray = np.dot(array[...,:3], [0.2989, 0.5870, 0.1140]).astype(np.uint8)
-                frame = gray
-            elif array.ndim == 2:
-                # Already grayscale
-                frame = array
-            elif array.ndim == 3 and array.shape[2] == 1:
-                # Single channel
-                frame = array[:, :, 0]
-            else:
-                # Extract first channel
-                frame = array[:, :, 0] if array.ndim == 3 else array
+                    self._picam2_started = True
+            except Exception as e:
+                logger.warning(f"Could not start camera for grayscale preview: {e}")
+            lores_size = self._ensure_grayscale_lores(
+                canvas_width, canvas_height, (params.res_x, params.res_y), params.fps
+            )
+        self._gray_requests.append((canvas_width, canvas_height, lores_size))
+        self._ensure_grayscale_worker()
+        self._gray_request_evt.set()
+    
+    def _ensure_grayscale_worker(self) -> None:
+        """Start the grayscale preview worker thread if it is not running."""
+        if self._gray_worker is None or not self._gray_worker.is_alive():
+            self._gray_worker = threading.Thread(
+                target=self._grayscale_worker, name="GrayscalePreview", daemon=True
+            )
+            self._gray_worker.start()
+    
+    def _grayscale_worker(self) -> None:
+        """Worker loop: serve the latest grayscale preview request off the Tk thread."""
+        while self._running.is_set():
+            if not self._gray_request_evt.wait(timeout=0.5):
+                continue
+            self._gray_request_evt.clear()
+            try:
+                canvas_width, canvas_height, lores_size = self._gray_requests.pop()
+            except IndexError:
+                continue
+            if self.picam2 is None or self._measuring_fps:
+                continue
+            try:
+                pil_image = self._capture_grayscale_image(canvas_width, canvas_height, lores_size)
+            except Exception as e:
+                logger.error(f"Error showing grayscale preview: {e}")
+                message = f"Preview error: {e}"
+                try:
+                    self.window.after(0, lambda: self.preview_info_label.config(text=message, fg="red"))
+                except Exception:
+                    pass
+                continue
+            if pil_image is None:
+                continue
+            self._gray_results.append((pil_image, canvas_width, canvas_height))
+            try:
+                self.window.after_idle(self._apply_pil_to_canvas)
+            except Exception:
+                # Window already destroyed
+                return
+    
+    def _apply_pil_to_canvas(self) -> None:
+        """Tk thread: display the latest image produced by the grayscale worker."""
+        try:
+            pil_image, canvas_width, canvas_height = self._gray_results.pop()
+        except IndexError:
+            return
+        if not self._running.is_set():
+            return
+        # Show canvas below info label and display the frame
+        self.grayscale_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._display_on_canvas(pil_image, canvas_width, canvas_height)
+        self.preview_info_label.config(
+            text="✓ Grayscale preview (captured image shown below)",
+            fg="blue"
+        )
+    
+    def _capture_grayscale_image(
+        self,
+        canvas_width: int,
+        canvas_height: int,
+        lores_size: Optional[Tuple[int, int]],
+    ) -> Optional[Image.Image]:
+        """
+        Capture one Pi HQ frame and convert it to a canvas-sized grayscale image.
+
+        Runs on the grayscale worker thread, so it must not touch Tk. The camera is
+        configured by _show_grayscale_preview on the Tk thread; this only grabs a frame.
+
+        Args:
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+            lores_size: Lores stream (width, height) set up for the canvas, or None for main
+
+        Returns:
+            PIL image for display, or None if no frame could be captured or converted
+        """
+        with self._camera_lock:
+            picam2 = self.picam2
+            if picam2 is None or not getattr(picam2, 'started', False):
+                return None
+            if lores_size is not None:
+                # Fall back to main if the camera was reconfigured since the request
+                camera_config = getattr(picam2, 'camera_config', None) or {}
+                lores = camera_config.get('lores')
+                if not lores or tuple(lores['size']) != lores_size:
+                    lores_size = None
+            # Prefer the canvas-sized lores Y plane (downscaled by the ISP) over the
+            # full-resolution main stream
+            stream = "lores" if lores_size is not None else "main"
             
-            if frame is not None:
-                # Convert to PIL Image
-                if frame.ndim == 2:
-                    pil_image = Image.fromarray(frame, mode='L')
-                else:
-                    pil_image = Image.fromarray(frame)
-                
-                # Resize to fit canvas
-                canvas_width = self.grayscale_canvas.winfo_width()
-                canvas_height = self.grayscale_canvas.winfo_height()
-                if canvas_width > 1 and canvas_height > 1:
-                    pil_image = pil_image.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-                
-                # Convert to PhotoImage and display
-                photo = ImageTk.PhotoImage(image=pil_image)
-                
-                # Show canvas below info label
-                self.grayscale_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-                
-                # Update canvas
-                if self.grayscale_image_id is None:
-                    self.grayscale_image_id = self.grayscale_canvas.create_image(
-                        canvas_width // 2,
-                        canvas_height // 2,
-                        image=photo,
-                        anchor='center'
-                    )
-                else:
-                    self.grayscale_canvas.itemconfig(self.grayscale_image_id, image=photo)
-                    self.grayscale_canvas.coords(
-                        self.grayscale_image_id,
-                        canvas_width // 2,
-                        canvas_height // 2
-                    )
-                
-                # Keep reference to prevent garbage collection
-                self.grayscale_canvas.photo = photo
-                
-                self.preview_info_label.config(
-                    text="✓ Grayscale preview (captured image shown below)",
-                    fg="blue"
-                )
-        except Exception as e:
-            logger.error(f"Error showing grayscale preview: {e}")
-            self.preview_info_label.config(
-                text=f"Preview error: {e}",
-                fg="red"
+            # Convert straight from the mapped camera buffer (no capture_array copy);
+            # the result is copied/resized into memory we own before the request is released
+            request = picam2.capture_request()
+            try:
+                with MappedArray(request, stream) as mapped:
+                    array = mapped.array
+                    if lores_size is not None:
+                        lores_w, lores_h = lores_size
+                        array = array[:lores_h, :lores_w]
+                    pil_image = self._gray_image_for_canvas(array, canvas_width, canvas_height)
+            finally:
+                request.release()
+        # The reused resize buffer is shared with the Tk-thread previews; hand over a copy
+        return pil_image.copy() if pil_image is not None else None
+    
+    def _gray_image_for_canvas(self, array: np.ndarray, canvas_width: int, canvas_height: int) -> Optional[Image.Image]:
+        """
+        Convert a Pi HQ frame to a canvas-sized grayscale image that owns its pixels.
+
+        Safe to call on a mapped camera buffer: the returned image never references
+        the input array.
+
+        Args:
+            array: Y plane (2D) or RGB/RGBX frame
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+
+        Returns:
+            PIL image for display, or None if the frame could not be converted
+        """
+        # Decimate first so the color conversion only touches ~canvas-sized input
+        array = _decimate_for_canvas(array, canvas_width, canvas_height)
+        
+        # Convert to grayscale (the lores Y plane is already luma)
+        if array.ndim == 2:
+            # Already grayscale
+            frame = array
+        elif array.ndim == 3 and array.shape[2] == 4:
+            # XBGR8888 (Picamera2 preview default) is [R, G, B, X] in memory
+            frame = cv2.cvtColor(array, cv2.COLOR_RGBA2GRAY)
+        elif array.ndim == 3 and array.shape[2] == 3:
+            # RGB888 is [B, G, R] in memory
+            frame = cv2.cvtColor(array, cv2.COLOR_BGR2GRAY)
+        elif array.ndim == 3 and array.shape[2] == 1:
+            # Single channel
+            frame = array[:, :, 0]
+        else:
+            # Extract first channel
+            frame = array[:, :, 0] if array.ndim == 3 else array
+        
+        if frame is None:
+            return None
+        
+        # Resize to fit canvas (into the reused buffer when possible)
+        if frame.ndim == 2 and canvas_width > 1 and canvas_height > 1:
+            return self._resize_gray_to_canvas(frame, canvas_width, canvas_height)
+        pil_image = _pil_view(frame)
+        if canvas_width > 1 and canvas_height > 1:
+            return pil_image.resize((canvas_width, canvas_height), Image.Resampling.BILINEAR)
+        # The view may share memory with the (mapped) input
+        return pil_image.copy()
+    
+    def _ensure_grayscale_lores(
+        self,
+        canvas_width: int,
+        canvas_height: int,
+        resolution: Tuple[int, int],
+        fps: float,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Make sure Picamera2 has a YUV420 lores stream roughly matching the canvas.
+
+        Tk thread, called with _camera_lock held.
+
+        The camera is only reconfigured when the lores size differs from the canvas by
+        more than LORES_HYSTERESIS_PX in either dimension, so small window resizes do
+        not restart the camera.
+
+        Args:
+            canvas_width: Current canvas width in pixels
+            canvas_height: Current canvas height in pixels
+            resolution: Main stream (width, height)
+            fps: Target frame rate
+
+        Returns:
+            (width, height) of the lores stream, or None to fall back to the main stream
+        """
+        if self.picam2 is None or canvas_width <= 1 or canvas_height <= 1:
+            return None
+
+        res_x, res_y = resolution
+        # YUV420 needs even dimensions; lores can never be larger than main
+        want_w = min(canvas_width, res_x) & ~1
+        want_h = min(canvas_height, res_y) & ~1
+        if want_w < 2 or want_h < 2:
+            return None
+
+        current_lores = None
+        current_main = None
+        try:
+            camera_config = getattr(self.picam2, 'camera_config', None) or {}
+            if camera_config.get('lores'):
+                current_lores = tuple(camera_config['lores']['size'])
+            if camera_config.get('main'):
+                current_main = tuple(camera_config['main']['size'])
+        except Exception:
+            pass
+
+        if (
+            current_lores is not None
+            and current_main == (res_x, res_y)
+            and abs(current_lores[0] - want_w) <= self.LORES_HYSTERESIS_PX
+            and abs(current_lores[1] - want_h) <= self.LORES_HYSTERESIS_PX
+        ):
+            return current_lores
+
+        try:
+            if hasattr(self.picam2, 'started') and self.picam2.started:
+                self.picam2.stop()
+            self.picam2_config = self.picam2.create_preview_configuration(
+                main={"size": (res_x, res_y)},
+                lores={"size": (want_w, want_h), "format": "YUV420"},
+                controls={"FrameRate": fps},
+                buffer_count=4
             )
+            self.picam2.configure(self.picam2_config)
+            self.picam2.start()
+            self._picam2_started = True
+            self._current_size = (res_x, res_y)
+            self._current_fps = fps
+            self._preview_config_key = (res_x, res_y, fps, "grayscale")
+            logger.info(f"Configured grayscale lores stream: {want_w}x{want_h} (main {res_x}x{res_y})")
+            return (want_w, want_h)
+        except Exception as e:
+            logger.warning(f"Could not configure lores stream, using main stream: {e}")
+            try:
+                if hasattr(self.picam2, 'started') and not self.picam2.started:
+                    self.picam2.start()
+                    self._picam2_started = True
+            except Exception:
+                pass
+            return None
+
+    def _resize_gray_to_canvas(self, frame: np.ndarray, canvas_width: int, canvas_height: int) -> Image.Image:
+        """
+        Resize a 2D grayscale frame to the canvas size into a reused buffer.
+
+        The destination array is only reallocated when the canvas size changes, so
+        steady-state preview ticks do no per-frame allocation for the resize.
+
+        Args:
+            frame: 2D uint8 grayscale frame (may be a strided Y-plane view)
+            canvas_width: Target width in pixels
+            canvas_height: Target height in pixels
+
+        Returns:
+            PIL 'L' image sharing memory with the resize buffer (the same object
+            is returned until the canvas size changes)
+        """
+        # YUV420 Y-plane views (array[:h, :w]) keep the padded row stride; cv2 reads
+        # such views directly, so only copy when pixels themselves are not adjacent
+        if frame.strides[1] != frame.itemsize:
+            frame = np.ascontiguousarray(frame)
+        buf = self._gray_resized_buf
+        if buf is None or buf.shape != (canvas_height, canvas_width):
+            buf = np.empty((canvas_height, canvas_width), dtype=np.uint8)
+            self._gray_resized_buf = buf
+            # PIL image wrapping the same memory; the resize below updates it in place
+            self._gray_resized_img = Image.frombuffer("L", (canvas_width, canvas_height), buf, "raw", "L", 0, 1)
+        cv2.resize(frame, (canvas_width, canvas_height), dst=buf, interpolation=cv2.INTER_AREA)
+        return self._gray_resized_img
+
+    def _on_canvas_resize(self, event) -> None:
+        """Cache the preview canvas size so frames do not query Tk for it."""
+        self._canvas_w = event.width
+        self._canvas_h = event.height
     
+    def _display_on_canvas(self, pil_image: Image.Image, canvas_width: int, canvas_height: int) -> None:
+        """
+        Show an image centered on the preview canvas, reusing pooled PhotoImages.
+
+        A PhotoImage of matching size is updated in place with paste(), so the Tk
+        pixmap is only allocated when the displayed size changes. Only the two most
+        recently used sizes are kept.
+
+        Args:
+            pil_image: Image to display
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+        """
+        key = pil_image.size
+        pool = self._tk_photo_pool
+        photo = pool.pop(key, None)
+        if photo is not None:
+            photo.paste(pil_image)
+        else:
+            photo = ImageTk.PhotoImage(image=pil_image)
+        pool[key] = photo
+        while len(pool) > 2:
+            pool.pop(next(iter(pool)))
+
+        center = (canvas_width // 2, canvas_height // 2)
+        if self.grayscale_image_id is None:
+            self.grayscale_image_id = self.grayscale_canvas.create_image(
+                *center, image=photo, anchor="center"
+            )
+            self._image_center = center
+        else:
+            if getattr(self.grayscale_canvas, "photo", None) is not photo:
+                self.grayscale_canvas.itemconfig(self.grayscale_image_id, image=photo)
+            # Moving the item damages both its old and new bounding boxes; only do it on resize
+            if center != self._image_center:
+                self.grayscale_canvas.coords(self.grayscale_image_id, *center)
+                self._image_center = center
+        # Keep reference to prevent garbage collection
+        self.grayscale_canvas.photo = photo
+
     def _hide_grayscale_preview(self) -> None:
         """Hide grayscale preview canvas."""
         self.grayscale_canvas.pack_forget()
@@ -763,23 +1493,17 @@ class PreviewWindow:
         
         try:
             if mode == "Image":
+                if self._measuring_fps:
+                    self.status_label.config(text="FPS measurement in progress...", fg="orange")
+                    return
                 # Capture single image
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                output_dir = "outputs"
-                os.makedirs(output_dir, exist_ok=True)
-                
-                # Get selected format
-                image_format = self.image_format_var.get().upper()
-                if image_format == "JPEG":
-                    ext = ".jpg"
-                else:  # Default to PNG
-                    ext = ".png"
+                ext = _IMAGE_EXT.get(self.image_format_var.get(), ".png")
+                output_path = self._quick_capture_path("capture", ext)
                 
-                output_path = os.path.join(output_dir, f"capture_{timestamp}{ext}")
-                
-                success = self.capture_manager.capture_image(output_path)
+                with self._camera_lock:
+                    success = self.capture_manager.capture_image(str(output_path))
                 if success:
-                    self.status_label.config(text=f"Saved: {os.path.basename(output_path)}", fg="green")
+                    self.status_label.config(text=f"Saved: {output_path.name}", fg="green")
                     # Update grayscale preview if in grayscale mode
                     if "Grayscale" in self.capture_type_var.get():
                         self._show_grayscale_preview()
@@ -792,28 +1516,50 @@ class PreviewWindow:
                     output_path = self.capture_manager.stop_video_recording(codec="FFV1")
                     if output_path:
                         self.status_label.config(text=f"Saved: {os.path.basename(output_path)}", fg="green")
-                        self.quick_capture_btn.config(text="Quick Capture", bg="#2196F3")
                         self._recording = False
+                        self._set_recording_ui(False)
                     else:
                         self.status_label.config(text="Recording failed", fg="red")
                 else:
                     # Start recording
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    output_dir = "outputs"
-                    os.makedirs(output_dir, exist_ok=True)
-                    output_path = os.path.join(output_dir, f"video_{timestamp}.avi")
+                    output_path = self._quick_capture_path("video", ".avi")
                     
-                    success = self.capture_manager.start_video_recording(output_path, codec="FFV1")
+                    success = self.capture_manager.start_video_recording(str(output_path), codec="FFV1")
                     if success:
                         self.status_label.config(text="Recording...", fg="red")
-                        self.quick_capture_btn.config(text="Stop Recording", bg="red")
                         self._recording = True
+                        self._set_recording_ui(True)
                     else:
                         self.status_label.config(text="Failed to start recording", fg="red")
         except Exception as e:
             self.status_label.config(text=f"Error: {e}", fg="red")
             logger.error(f"Quick capture error: {e}")
     
+    def _quick_capture_path(self, prefix: str, ext: str) -> Path:
+        """
+        Build a timestamped quick capture path that does not overwrite an earlier capture.
+
+        Timestamps have one-second resolution; further captures within the same second
+        get a _1, _2, ... suffix instead of reusing the name.
+        """
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        if timestamp != self._last_capture_stamp:
+            self._last_capture_stamp = timestamp
+            self._capture_stamp_seq = 0
+            return self._outputs_dir / f"{prefix}_{timestamp}{ext}"
+        self._capture_stamp_seq += 1
+        return self._outputs_dir / f"{prefix}_{timestamp}_{self._capture_stamp_seq}{ext}"
+    
+    def _set_recording_ui(self, recording: bool) -> None:
+        """Switch the Quick Capture button between idle and recording looks (no-op if unchanged)."""
+        if recording == self._recording_ui_state:
+            return
+        if recording:
+            self.quick_capture_btn.config(text="Stop Recording", bg="red")
+        else:
+            self.quick_capture_btn.config(text="Quick Capture", bg="#2196F3")
+        self._recording_ui_state = recording
+    
     def on_measure_fps(self) -> None:
         """Measure maximum capture FPS using method matching current capture type."""
         if self._simulate_cam:
@@ -830,133 +1576,172 @@ class PreviewWindow:
             self.status_label.config(text="FPS measurement in progress...", fg="orange")
             return
         
-        def measure_fps_thread():
-            """Measure capture FPS using method matching capture type in a separate thread."""
-            self._measuring_fps = True
-            self.measure_fps_btn.config(state="disabled", text="Measuring...")
+        # Read Tk-backed settings here; the measurement itself runs on the executor
+        was_preview_active = self._native_preview_active
+        params = self._parse_cap_params(default_fps=250.0)  # 250 for maximum FPS like in gist
+        
+        self._measuring_fps = True
+        self.measure_fps_btn.config(state="disabled", text="Measuring...")
+        self._ensure_fps_updates()
+        # Stop native preview if active (Tk thread; the measurement restarts it when done)
+        self._stop_native_preview()
+        future = self._executor.submit(self._do_measure_fps, params, was_preview_active)
+        future.add_done_callback(lambda f: self._on_measure_done(f, params.is_grayscale))
+    
+    def _do_measure_fps(self, params: _CaptureParams, was_preview_active: bool) -> bool:
+        """
+        Measure capture FPS on the executor thread (stops the camera and restores its config).
+
+        Args:
+            params: Resolution, target FPS and capture type, used for both measuring and restoring
+            was_preview_active: Whether native preview was active before measurement
+
+        Returns:
+            True if the preview configuration was restored and the preview should restart
+        """
+        # Pin this thread to the last allowed CPU so the Tk/preview threads (which
+        # usually run on lower cores) do not steal its time slices; Linux only
+        saved_affinity = None
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                saved_affinity = os.sched_getaffinity(0)
+                if len(saved_affinity) > 1:
+                    os.sched_setaffinity(0, {max(saved_affinity)})
+            except OSError as e:
+                logger.debug(f"Could not set FPS measurement CPU affinity: {e}")
+                saved_affinity = None
+        try:
+            # Use Picamera2 method for all capture types (Color, Grayscale, Player One uses different FPS path)
+            self._post_status("Stopping preview and measuring FPS...", "orange")
+            with self._camera_lock:
+                return self._measure_fps_picamera2(params, was_preview_active)
             
-            # Store current preview state
-            was_preview_active = self._native_preview_active
-            previous_backend = self._preview_backend
+        except Exception as e:
+            logger.error(f"Error measuring FPS: {e}", exc_info=True)
+            self._post_status(f"FPS measurement error: {e}", "red")
             
-            try:
-                # Stop native preview if active
-                self._stop_native_preview()
-                
-                # Get current settings
-                try:
-                    res_x, res_y = self.get_resolution()
-                    target_fps = float(self.fps_var.get().strip())
-                except ValueError:
-                    res_x, res_y = self.get_resolution()
-                    target_fps = 250.0  # Use 250 for maximum FPS like in gist
-                
-                # Use Picamera2 method for all capture types (Color, Grayscale, Player One uses different FPS path)
-                self.status_label.config(text="Stopping preview and measuring FPS...", fg="orange")
-                self._measure_fps_picamera2(res_x, res_y, target_fps, was_preview_active)
-                
-            except Exception as e:
-                logger.error(f"Error measuring FPS: {e}", exc_info=True)
-                self.status_label.config(text=f"FPS measurement error: {e}", fg="red")
-                
-                # Try to restore preview even on error
+            # Try to restore preview even on error
+            with self._camera_lock:
+                return self._restore_preview_config(params, was_preview_active)
+        finally:
+            # The executor thread is reused; give it back its original CPU set
+            if saved_affinity is not None:
                 try:
-                    res_x, res_y = self.get_resolution()
-                    fps = float(self.fps_var.get().strip())
-                except ValueError:
-                    res_x, res_y = self.get_resolution()
-                    fps = 30.0
-                
-                self._restore_preview_config(res_x, res_y, fps, was_preview_active)
-                
-            finally:
-                self._measuring_fps = False
-                self.measure_fps_btn.config(state="normal", text="Measure FPS")
-        
-        # Start measurement in separate thread
-        thread = threading.Thread(target=measure_fps_thread, daemon=True)
-        thread.start()
+                    os.sched_setaffinity(0, saved_affinity)
+                except OSError as e:
+                    logger.debug(f"Could not restore CPU affinity: {e}")
     
-    def _measure_fps_picamera2(self, w: int, h: int, target_fps: float, was_preview_active: bool) -> None:
-        """Measure FPS using Picamera2 method (for Picamera2 Color or Grayscale)."""
-        if self.picam2 is None:
-            self.status_label.config(text="Camera not available", fg="red")
+    def _on_measure_done(self, future: concurrent.futures.Future, is_grayscale: bool) -> None:
+        """Executor done-callback: clear the measuring flag and finish up on the Tk thread."""
+        self._measuring_fps = False
+        if not self._running.is_set():
+            return
+        restart = not future.cancelled() and future.exception() is None and bool(future.result())
+        try:
+            self.window.after(0, self._finish_measure_fps, restart, is_grayscale)
+        except Exception as e:
+            logger.debug(f"Could not re-enable Measure FPS button: {e}")
+    
+    def _finish_measure_fps(self, restart: bool, is_grayscale: bool) -> None:
+        """Tk thread: re-enable the Measure FPS button and restart the preview."""
+        if not self._running.is_set():
+            return
+        self.measure_fps_btn.config(state="normal", text="Measure FPS")
+        if not restart:
             return
+        if is_grayscale:
+            self._show_grayscale_preview()
+        else:
+            self._start_native_preview()
+    
+    def _post_status(self, text: str, fg: str) -> None:
+        """Update the status label from any thread by scheduling it on the Tk event loop."""
+        try:
+            self.window.after(0, lambda: self.status_label.config(text=text, fg=fg))
+        except Exception as e:
+            logger.debug(f"Could not post status update: {e}")
+    
+    def _measure_fps_picamera2(self, params: _CaptureParams, was_preview_active: bool) -> bool:
+        """
+        Measure FPS using Picamera2 method (for Picamera2 Color or Grayscale).
+
+        Frames are counted by a post_callback for a fixed window. Uses buffer_count=1:
+        nothing holds requests, so extra queued buffers would only add stale frames
+        and DMA memory, and the count follows the sensor cadence rather than queue
+        drain. Preview restore keeps the 2-buffer setup on purpose.
+
+        Returns:
+            True if the preview configuration was restored and the preview should restart
+        """
+        if self.picam2 is None:
+            self._post_status("Camera not available", "red")
+            return False
         
-        res_x, res_y = w, h
+        res_x, res_y, target_fps = params.res_x, params.res_y, params.fps
+        w, h = res_x, res_y
         
         try:
             # Stop camera if running (required before configuring)
-            if hasattr(self.picam2, 'started') and self.picam2.started:
-                try:
-                    self.picam2.stop()
-                    time.sleep(0.2)  # Give camera time to fully stop
-                except Exception as e:
-                    logger.warning(f"Error stopping camera before FPS measurement: {e}")
-            
-            # Check if grayscale mode
-            current_capture_type = self.capture_type_var.get()
-            is_grayscale = "Grayscale" in current_capture_type
+            self._quiesce_camera()
             
-            # Configure for capture (YUV420 format for grayscale, default for color)
-            # Use buffer_count=2 for optimal FPS performance
-            if is_grayscale:
-                config = self.picam2.create_video_configuration(
-                    main={"size": (w, h), "format": "YUV420"},
-                    controls={"FrameRate": target_fps},
-                    buffer_count=2  # Optimize for high FPS
-                )
-            else:
-                config = self.picam2.create_video_configuration(
-                    main={"size": (w, h)},
-                    controls={"FrameRate": target_fps},
-                    buffer_count=2  # Optimize for high FPS
-                )
+            # One configuration for both modes: grayscale only zeroes Saturation in the ISP,
+            # since the measurement counts frame arrivals and never reads pixels.
+            # Single buffer: late frames are discarded instead of queued (preview restore uses 2)
+            controls = {"FrameRate": target_fps}
+            if params.is_grayscale:
+                controls["Saturation"] = 0.0
+            config = self.picam2.create_video_configuration(
+                main={"size": (w, h)},
+                controls=controls,
+                buffer_count=1
+            )
             
-            # Configure and start with proper delays
+            # Configure and start; wait for the first frame rather than a fixed warm-up
+            # so start-up latency is not counted in the measurement window
             self.picam2.configure(config)
-            time.sleep(0.1)  # Brief pause after configure
+            self._preview_config_key = None
             self.picam2.start()
-            time.sleep(0.3)  # Wait for camera to be ready
+            self._picam2_started = True
+            try:
+                self.picam2.capture_request().release()
+            except Exception as e:
+                logger.warning(f"No first frame before FPS measurement: {e}")
             
             # Measure FPS
-            self.status_label.config(text="Measuring FPS (5 seconds)...", fg="orange")
-            fps_tracker = FPSTracker()
-            start_time = time.time()
-            frame_count = 0
+            self._post_status("Measuring FPS (5 seconds)...", "orange")
             measurement_duration = 5.0
+            # Count frames from Picamera2's own completion thread: every delivered frame
+            # is seen with one increment and no Python capture loop to keep up
+            counter = [0]
             
-            while time.time() - start_time < measurement_duration:
-                try:
-                    array = self.picam2.capture_array("main")
-                    
-                    # Process frame based on format
-                    if is_grayscale:
-                        # Extract Y channel from YUV420 efficiently
-                        # YUV420 format: first h rows are Y channel, rest is U/V
-                        if array.ndim == 2:
-                            # Full YUV420 frame - extract Y channel (first h rows)
-                            if array.shape[0] >= h:
-                                gray_frame = array[:h, :w]
-                            else:
-                                gray_frame = array
-                        elif array.ndim == 3:
-                            # 3D array - extract Y channel (first channel)
-                            gray_frame = array[:, :, 0] if array.shape[2] >= 1 else array
-                        else:
-                            gray_frame = array
-                    else:
-                        # Color frame - no processing needed for FPS measurement
-                        pass
-                    
-                    fps_tracker.update()
-                    frame_count += 1
-                except Exception as e:
-                    logger.warning(f"Frame capture error: {e}")
-                    time.sleep(0.01)
+            def count_frame(request):
+                counter[0] += 1
+            
+            previous_callback = self.picam2.post_callback
+            self.picam2.post_callback = count_frame
+            try:
+                # Monotonic integer clock: immune to NTP steps and cheaper than time.time()
+                start_ns = time.monotonic_ns()
+                deadline_ns = start_ns + int(measurement_duration * 1e9)
+                mono = time.monotonic_ns
+                running = self._running.is_set
+                # Wake periodically only for progress and to notice the window closing
+                while running() and mono() < deadline_ns:
+                    time.sleep(min(0.25, max(0.0, (deadline_ns - mono()) / 1e9)))
+                    self._post_status(f"Measuring FPS... {counter[0]} frames", "orange")
+                end_ns = mono()
+                frame_count = counter[0]
+            finally:
+                self.picam2.post_callback = previous_callback
+            
+            if not self._running.is_set():
+                # Window closed mid-measurement: _do_close owns the camera and the Tk
+                # widgets now, so store nothing and don't restore or post status
+                logger.info("FPS measurement abandoned: preview window closed")
+                return False
             
-            measured_fps = fps_tracker.get_fps()
-            actual_duration = time.time() - start_time
+            actual_duration = (end_ns - start_ns) / 1e9
+            measured_fps = frame_count / actual_duration if actual_duration > 0 else 0.0
             
             # Store measured FPS
             self._measured_fps = measured_fps
@@ -968,41 +1753,70 @@ class PreviewWindow:
             self.picam2.stop()
             
             # Restore preview configuration
-            self._restore_preview_config(res_x, res_y, target_fps, was_preview_active)
+            restored = self._restore_preview_config(params, was_preview_active)
             
             # Update status with measured FPS
-            self.status_label.config(
-                text=f"FPS: {measured_fps:.1f} at {res_x}x{res_y} ({frame_count} frames in {actual_duration:.2f}s)",
-                fg="green"
+            self._post_status(
+                f"FPS: {measured_fps:.1f} at {res_x}x{res_y} ({frame_count} frames in {actual_duration:.2f}s)",
+                "green"
             )
             logger.info(f"Measured FPS using Picamera2: {measured_fps:.1f} at {res_x}x{res_y}")
+            return restored
             
         except Exception as e:
             logger.error(f"Error in Picamera2 FPS measurement: {e}", exc_info=True)
-            self.status_label.config(text=f"Picamera2 FPS measurement error: {e}", fg="red")
+            self._post_status(f"Picamera2 FPS measurement error: {e}", "red")
             # Restore preview even on error
-            self._restore_preview_config(res_x, res_y, target_fps, was_preview_active)
+            return self._restore_preview_config(params, was_preview_active)
     
-    def _restore_preview_config(self, res_x: int, res_y: int, fps: float, was_preview_active: bool) -> None:
-        """Restore preview configuration after FPS test."""
+    def _quiesce_camera(self, settle_s: Optional[float] = None) -> None:
+        """
+        Stop picam2 if it is running and pause briefly before it is reconfigured.
+
+        Args:
+            settle_s: Pause after stop() in seconds; defaults to the
+                hardware.camera.stop_settle_s config value (0.05)
+        """
+        if self.picam2 is None or not getattr(self.picam2, 'started', False):
+            return
+        self._preview_config_key = None
+        try:
+            self.picam2.stop()
+            time.sleep(self._stop_settle_s if settle_s is None else settle_s)
+        except Exception as e:
+            logger.warning("Error stopping picam2 before reconfiguring: %s", e)
+    
+    def _restore_preview_config(self, params: _CaptureParams, was_preview_active: bool) -> bool:
+        """
+        Restore preview configuration after FPS test (executor thread; does not touch Tk).
+
+        Called with _camera_lock held.
+
+        The preview itself is restarted on the Tk thread by _finish_measure_fps.
+
+        Args:
+            params: Settings snapshot taken on the Tk thread when the measurement started
+            was_preview_active: Whether native preview was active before measurement
+
+        Returns:
+            True if the camera is running the preview configuration again
+        """
+        if not self._running.is_set():
+            return False
+        res_x, res_y, fps = params.res_x, params.res_y, params.fps
         if self.picam2 is None:
             try:
-                from picamera2 import Picamera2
                 self.picam2 = Picamera2()
                 logger.info("Created new Picamera2 instance for preview restore")
             except Exception as e:
-                logger.error(f"Cannot restore preview config: failed to create Picamera2 ({e})")
-                return
+                logger.error("Cannot restore preview config: failed to create Picamera2 (%s)", e)
+                return False
         
+        # No "configuration unchanged" shortcut here: the measurement always replaces
+        # the preview configuration (single-buffer video config), so it must be rebuilt
         try:
             # Always ensure camera is stopped before reconfiguring
-            try:
-                if hasattr(self.picam2, 'started') and self.picam2.started:
-                    self.picam2.stop()
-                    logger.info("Stopped picam2 before restoring preview config")
-                    time.sleep(0.3)  # Wait for stop to complete
-            except Exception as e:
-                logger.warning(f"Error stopping picam2 before restore: {e}")
+            self._quiesce_camera()
             
             # Create new preview configuration
             self.picam2_config = self.picam2.create_preview_configuration(
@@ -1013,38 +1827,49 @@ class PreviewWindow:
             
             # Configure the camera
             self.picam2.configure(self.picam2_config)
-            time.sleep(0.1)  # Brief pause after configure
+            
+            # Signal readiness from the first frame instead of sleeping a fixed time,
+            # then hand over to the FPS tracking callback
+            self._first_frame_evt = threading.Event()
+            
+            def first_frame_callback(request):
+                self._first_frame_evt.set()
+                if self._fps_tracking:
+                    self.picam2.post_callback = self._fps_callback
+                    self._fps_callback(request)
+                else:
+                    self.picam2.post_callback = None
+            
+            self.picam2.post_callback = first_frame_callback
             
             # Start the camera
             self.picam2.start()
-            logger.info(f"Started picam2 for preview: {res_x}x{res_y} @ {fps} FPS")
-            
-            # Restore FPS tracking callback
-            if self.fps_tracker:
-                def restore_callback(request):
-                    if self.fps_tracker:
-                        self.fps_tracker.update()
-                self.picam2.post_callback = restore_callback
+            self._picam2_started = True
+            self._current_size = (res_x, res_y)
+            self._current_fps = fps
+            self._preview_config_key = (res_x, res_y, fps, "plain")
+            logger.info("Started picam2 for preview: %dx%d @ %s FPS", res_x, res_y, fps)
             
             # Wait for camera to be ready
-            time.sleep(0.3)
-            
-            # Restart preview (now that FPS check is complete)
-            if "Grayscale" not in self.capture_type_var.get():
-                self._start_native_preview()
-            else:
-                self._show_grayscale_preview()
+            if not self._first_frame_evt.wait(timeout=1.0):
+                logger.warning("No frame received within 1.0s after restoring preview config")
+            return True
                 
         except Exception as e:
-            logger.error(f"Error restoring preview config: {e}", exc_info=True)
+            logger.error("Error restoring preview config: %s", e, exc_info=True)
+            return False
     
     def on_close(self) -> None:
-        """Handle window close. Guarded so double-close is safe."""
-        if getattr(self, "_closing", False):
+        """Handle window close. Idempotent: only the first call does any work."""
+        if self._closed:
             return
-        self._closing = True
+        self._closed = True
+        # Snapshot Tk-backed settings once, before any teardown, so the save path
+        # never touches Tk (it runs on a worker thread)
+        target_fps_opt = _safe_float(self.fps_var.get)
+        res_opt = _safe_tuple(self.get_resolution)
         try:
-            self._do_close()
+            self._do_close(target_fps_opt, res_opt)
         except Exception as e:
             logger.error("Error during preview window close: %s", e)
             try:
@@ -1052,62 +1877,93 @@ class PreviewWindow:
                     self.window.destroy()
             except Exception:
                 pass
-        finally:
-            self._closing = False
 
-    def _do_close(self) -> None:
-        """Perform close: stop preview, recording, cleanup, destroy."""
-        # Stop FPS update loop
-        self._running = False
+    def _do_close(self, target_fps_opt: Optional[float], res_opt: Optional[Tuple[int, int]]) -> None:
+        """
+        Perform close: stop preview, recording, cleanup, destroy.
 
-        # Save measured FPS if available
-        if self._measured_fps is not None and self._measured_fps > 0:
-            try:
-                from robocam.config import get_config
-                config = get_config()
-                # Save measured FPS
-                config.set("hardware.camera.last_measured_fps", self._measured_fps)
-                # Also save the target FPS from the entry
-                try:
-                    target_fps = float(self.fps_var.get().strip())
-                    config.set("hardware.camera.last_target_fps", target_fps)
-                except ValueError:
-                    pass
-                # Save resolution if available
-                try:
-                    res_x, res_y = self.get_resolution()
-                    config.set("hardware.camera.last_measured_resolution", [res_x, res_y])
-                except ValueError:
-                    pass
-                config.save_config()
-                logger.info(f"Saved FPS: {self._measured_fps:.1f} FPS")
-            except Exception as e:
-                logger.warning(f"Could not save FPS to config: {e}")
+        Args:
+            target_fps_opt: Target FPS snapshotted from the entry, or None if invalid
+            res_opt: Resolution snapshotted from the dropdown, or None if unavailable
+        """
+        # Stop FPS update loop (and wake the grayscale worker so it exits)
+        self._running.clear()
+        self._gray_request_evt.set()
+        # Do not wait for an in-flight FPS measurement; it checks _running between frames
+        self._executor.shutdown(wait=False)
+
+        # Save measured FPS if available (disk I/O runs off the UI thread)
+        persist_thread: Optional[threading.Thread] = None
+        measured_fps = self._measured_fps
+        if measured_fps and measured_fps > 0:
+            snapshot = {"hardware.camera.last_measured_fps": measured_fps}
+            if target_fps_opt is not None:
+                snapshot["hardware.camera.last_target_fps"] = target_fps_opt
+            if res_opt is not None:
+                snapshot["hardware.camera.last_measured_resolution"] = list(res_opt)
+            persist_thread = threading.Thread(target=self._persist, args=(snapshot,), daemon=True)
+            persist_thread.start()
         
         # Stop native preview and external camera preview
         self._stop_native_preview()
         self._stop_usb_preview()
 
-        # Stop recording if active
-        if self._recording and self.capture_manager:
-            try:
-                self.capture_manager.stop_video_recording(codec="MJPG")
-            except Exception as e:
-                logger.error(f"Error stopping recording: {e}")
-        
-        # Cleanup capture manager (if we created it)
-        if self.capture_manager is not None:
-            try:
-                self.capture_manager.cleanup()
-            except Exception as e:
-                logger.error(f"Error cleaning up capture manager: {e}")
-        
-        # Stop camera (if we created Pi HQ; Player One is owned by capture_manager or caller)
-        if self.picam2 is not None:
+        # Stop recording + cleanup capture manager and stop the camera concurrently;
+        # both can take hundreds of ms (encoder flush, libcamera teardown)
+        capture_manager = self.capture_manager
+        picam2 = self.picam2
+        recording = self._recording
+        capture_mgr_owned = self._capture_mgr_owned
+        # Skip stop() on a pipeline that was never started (it can still stall)
+        camera_started = picam2 is not None and (
+            self._picam2_started or bool(getattr(picam2, "started", False))
+        )
+
+        def shutdown_capture_manager():
+            # Stop recording if active
+            if recording:
+                try:
+                    capture_manager.stop_video_recording(codec="MJPG")
+                except Exception as e:
+                    logger.error("Error stopping recording: %s", e)
+            # Cleanup capture manager (only if we created it; callers clean up their own)
+            if capture_mgr_owned:
+                try:
+                    capture_manager.cleanup()
+                except Exception as e:
+                    logger.error("Error cleaning up capture manager: %s", e)
+
+        camera_lock = self._camera_lock
+
+        def stop_camera():
+            # Let an in-flight frame grab or measurement step finish first (bounded wait)
+            locked = camera_lock.acquire(timeout=1.0)
             try:
-                self.picam2.stop()
+                picam2.stop()
             except Exception as e:
-                logger.error(f"Error stopping camera: {e}")
+                logger.error("Error stopping camera: %s", e)
+            finally:
+                if locked:
+                    camera_lock.release()
+
+        shutdown_threads = []
+        if capture_manager is not None and (recording or capture_mgr_owned):
+            shutdown_threads.append(threading.Thread(target=shutdown_capture_manager, daemon=True))
+        # Stop camera (if we created Pi HQ; Player One is owned by capture_manager or caller).
+        # CaptureManager.cleanup() already stops its own picam2, so only stop here when
+        # it is a different instance (or not cleaned up by us) to avoid two threads
+        # stopping the same camera.
+        shared_with_manager = capture_mgr_owned and getattr(capture_manager, "picam2", None) is picam2
+        if camera_started and not shared_with_manager:
+            shutdown_threads.append(threading.Thread(target=stop_camera, daemon=True))
+        for thread in shutdown_threads:
+            thread.start()
+        for thread in shutdown_threads:
+            thread.join(timeout=2.0)
+
+        # Make sure the config write finished before the app may exit
+        if persist_thread is not None:
+            persist_thread.join(timeout=2.0)
 
         # Destroy window last so UI is still valid during cleanup
         try:
@@ -1115,6 +1971,17 @@ class PreviewWindow:
         except Exception as e:
             logger.warning("Error destroying preview window: %s", e)
     
+    @staticmethod
+    def _persist(snapshot: dict) -> None:
+        """Write snapshotted camera values (dot-notation keys) to the config file (runs on a worker thread)."""
+        try:
+            config = get_config()
+            config.update(snapshot)
+            config.save_config()
+            logger.info("Saved camera settings: %s", snapshot)
+        except Exception as e:
+            logger.warning("Could not save camera settings to config: %s", e)
+    
     def destroy(self) -> None:
         """Destroy the preview window."""
         self.on_close()
@@ -15,7 +15,8 @@ notification can be shown.
 Author: RoboCam-Suite
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from robocam.logging_config import get_logger
 
@@ -29,25 +30,45 @@ PI_HQ_MAX_RESOLUTION: Tuple[int, int] = (4056, 3040)
 USB_MARS_ASPECT_RATIO: Tuple[int, int] = (16, 9)
 USB_MARS_MAX_RESOLUTION: Tuple[int, int] = (1936, 1100)
 
+# (ratio numerator, ratio denominator, max width, max height) per camera, unpacked once per call
+_PI_HQ_LIMITS: Tuple[int, int, int, int] = (*PI_HQ_ASPECT_RATIO, *PI_HQ_MAX_RESOLUTION)
+_USB_MARS_LIMITS: Tuple[int, int, int, int] = (*USB_MARS_ASPECT_RATIO, *USB_MARS_MAX_RESOLUTION)
+
+# Default resolution keyed by is_pihq: 1920×1440 is a common high-res 4:3 choice for
+# Pi HQ, 1920×1080 the 16:9 equivalent for USB/Mars 662M
+_DEFAULT_RESOLUTIONS: Dict[bool, Tuple[int, int]] = {
+    True: (1920, 1440),
+    False: (1920, 1080),
+}
+
 
 def _clamp_to_max(
     width: int, height: int, max_w: int, max_h: int
 ) -> Tuple[int, int]:
-    """Clamp resolution to maximum while preserving aspect ratio."""
+    """Clamp resolution to maximum while preserving aspect ratio (integer math)."""
     if width <= max_w and height <= max_h:
         return (width, height)
-    scale = min(max_w / width, max_h / height)
-    w = int(round(width * scale))
-    h = int(round(height * scale))
+    # Scale by whichever of max_w/width and max_h/height is smaller, compared by
+    # cross-multiplication; the other side is rounded to nearest
+    if max_w * height <= max_h * width:
+        w = max_w
+        h = (2 * height * max_w + width) // (2 * width)
+    else:
+        w = (2 * width * max_h + height) // (2 * height)
+        h = max_h
     return (max(1, w), max(1, h))
 
 
+@lru_cache(maxsize=64)
 def correct_resolution_for_camera(
     width: int, height: int, is_pihq: bool
 ) -> Tuple[int, int, bool]:
     """
     Correct resolution to match camera's native aspect ratio.
 
+    Results are memoized (the UI only ever asks about a handful of preset sizes);
+    use correct_resolution_for_camera.cache_clear() to reset.
+
     Args:
         width: Requested width in pixels
         height: Requested height in pixels
@@ -59,26 +80,23 @@ def correct_resolution_for_camera(
     if width < 1 or height < 1:
         return (max(1, width), max(1, height), False)
 
-    if is_pihq:
-        target_ratio = PI_HQ_ASPECT_RATIO[0] / PI_HQ_ASPECT_RATIO[1]
-        max_w, max_h = PI_HQ_MAX_RESOLUTION
-    else:
-        target_ratio = USB_MARS_ASPECT_RATIO[0] / USB_MARS_ASPECT_RATIO[1]
-        max_w, max_h = USB_MARS_MAX_RESOLUTION
+    ar_num, ar_den, max_w, max_h = _PI_HQ_LIMITS if is_pihq else _USB_MARS_LIMITS
 
-    current_ratio = width / height
+    # Compare width/height against ar_num/ar_den by cross-multiplication (exact, no divides)
+    lhs = width * ar_den
+    rhs = height * ar_num
 
     # Check if already correct within small tolerance (0.5% to allow rounding)
-    if abs(current_ratio - target_ratio) / target_ratio < 0.005:
+    if abs(lhs - rhs) * 200 < rhs:
         return (width, height, False)
 
-    if current_ratio > target_ratio:
-        # Too wide: keep width, adjust height
-        new_height = int(round(width / target_ratio))
+    if lhs > rhs:
+        # Too wide: keep width, adjust height (rounded to nearest)
+        new_height = (width * ar_den + ar_num // 2) // ar_num
         new_width = width
     else:
-        # Too tall: keep height, adjust width
-        new_width = int(round(height * target_ratio))
+        # Too tall: keep height, adjust width (rounded to nearest)
+        new_width = (height * ar_num + ar_den // 2) // ar_den
         new_height = height
 
     new_width = max(1, new_width)
@@ -100,9 +118,4 @@ def get_default_resolution_for_camera(is_pihq: bool) -> Tuple[int, int]:
     Returns:
         (width, height) tuple
     """
-    if is_pihq:
-        # 4:3 - 1920×1440 is a common high-res choice
-        return (1920, 1440)
-    else:
-        # 16:9 - 1920×1080
-        return (1920, 1080)
+    return _DEFAULT_RESOLUTIONS[bool(is_pihq)]
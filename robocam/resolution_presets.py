@@ -3,33 +3,40 @@ Native capture resolution presets per camera backend.
 Used by preview and experiment so users pick only supported resolutions (no custom).
 """
 
-from typing import List, Optional, Tuple
+import re
+from typing import Dict, Optional, Sequence, Tuple
 
 from robocam.playerone_camera import PLAYERONE_SUPPORTED_RESOLUTIONS
 
 # Pi HQ (IMX477) 4:3 native resolutions
-PI_HQ_RESOLUTION_PRESETS: List[Tuple[int, int]] = [
+PI_HQ_RESOLUTION_PRESETS: Tuple[Tuple[int, int], ...] = (
     (4056, 3040),
     (2028, 1520),
     (1920, 1440),
     (1332, 990),
     (640, 480),
-]
+)
+
+
+# Presets keyed by (is_pihq, is_playerone); Player One wins when both are set
+_CAPTURE_PRESETS: Dict[Tuple[bool, bool], Tuple[Tuple[int, int], ...]] = {
+    (True, False): PI_HQ_RESOLUTION_PRESETS,
+    (True, True): PLAYERONE_SUPPORTED_RESOLUTIONS,
+    (False, True): PLAYERONE_SUPPORTED_RESOLUTIONS,
+    (False, False): PLAYERONE_SUPPORTED_RESOLUTIONS,
+}
 
 
 def get_capture_resolution_presets(
     is_pihq: bool,
     is_playerone: bool = False,
-) -> List[Tuple[int, int]]:
+) -> Sequence[Tuple[int, int]]:
     """
-    Return list of (width, height) presets for the current camera backend.
+    Return (width, height) presets for the current camera backend.
     Only these resolutions are shown in the dropdown (no custom).
+    The returned tuple is shared; callers that need to modify it should copy it with list().
     """
-    if is_playerone:
-        return list(PLAYERONE_SUPPORTED_RESOLUTIONS)
-    if is_pihq:
-        return list(PI_HQ_RESOLUTION_PRESETS)
-    return list(PLAYERONE_SUPPORTED_RESOLUTIONS)
+    return _CAPTURE_PRESETS[bool(is_pihq), bool(is_playerone)]
 
 
 def format_resolution_option(width: int, height: int) -> str:
@@ -37,30 +44,40 @@ def format_resolution_option(width: int, height: int) -> str:
     return f"{width}×{height}"
 
 
+# 'W×H', 'WxH' or 'W*H' with optional surrounding whitespace
+_RES_RE = re.compile(r'^\s*(\d+)\s*[×x*]\s*(\d+)\s*$')
+
+# Option strings for the built-in preset tuples, keyed by (width, height)
+_PI_HQ_PRESET_OPTIONS: Dict[Tuple[int, int], str] = {
+    (w, h): format_resolution_option(w, h) for w, h in PI_HQ_RESOLUTION_PRESETS
+}
+_PLAYERONE_PRESET_OPTIONS: Dict[Tuple[int, int], str] = {
+    (w, h): format_resolution_option(w, h) for w, h in PLAYERONE_SUPPORTED_RESOLUTIONS
+}
+
+
 def parse_resolution_option(s: str) -> Optional[Tuple[int, int]]:
     """Parse 'W×H' or 'WxH' to (width, height), or None."""
-    s = (s or "").strip()
-    for sep in ("×", "x", "*"):
-        if sep in s:
-            parts = s.split(sep, 1)
-            if len(parts) == 2:
-                try:
-                    w = int(parts[0].strip())
-                    h = int(parts[1].strip())
-                    if w > 0 and h > 0:
-                        return (w, h)
-                except ValueError:
-                    pass
-            return None
-    return None
-
-
-def resolution_to_preset_option(resolution: Tuple[int, int], presets: List[Tuple[int, int]]) -> str:
+    m = _RES_RE.match(s or "")
+    if not m:
+        return None
+    w = int(m.group(1))
+    h = int(m.group(2))
+    return (w, h) if w > 0 and h > 0 else None
+
+
+def resolution_to_preset_option(resolution: Tuple[int, int], presets: Sequence[Tuple[int, int]]) -> str:
     """If resolution is in presets, return its option string; else return first preset."""
     w, h = resolution
-    for pw, ph in presets:
-        if (pw, ph) == (w, h):
-            return format_resolution_option(pw, ph)
+    if presets is PI_HQ_RESOLUTION_PRESETS:
+        option = _PI_HQ_PRESET_OPTIONS.get((w, h))
+    elif presets is PLAYERONE_SUPPORTED_RESOLUTIONS:
+        option = _PLAYERONE_PRESET_OPTIONS.get((w, h))
+    else:
+        # Caller-built preset list: plain scan
+        option = next((format_resolution_option(pw, ph) for pw, ph in presets if (pw, ph) == (w, h)), None)
+    if option is not None:
+        return option
     if presets:
         return format_resolution_option(presets[0][0], presets[0][1])
     return format_resolution_option(1920, 1080)
@@ -8,11 +8,15 @@ as it includes M400 wait commands for reliable movement completion.
 Author: RoboCam-Suite
 """
 
+import logging
+import os
+import select
 import serial
 import serial.tools.list_ports
 import time
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from picamera2 import Picamera2
 from .config import get_config, Config
@@ -20,6 +24,31 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Printer config keys that are still accepted but no longer have any effect
+_IGNORED_PRINTER_KEYS = ("position_update_delay",)
+_ignored_keys_logged = False
+
+# Axis values in an M114 report, e.g. "X:10.00 Y:0.00 Z:5.00 E:0.00 Count X:800 Y:0 Z:2000"
+# (matched on the raw bytes read from the port; float() accepts bytes directly)
+_M114_RE = re.compile(rb'(?P<axis>[XYZ]):(?P<val>-?\d+(?:\.\d+)?)')
+
+
+def _g0_command(X: Optional[float], Y: Optional[float], Z: Optional[float],
+                speed: Optional[float]) -> bytes:
+    """Build a newline-terminated G0 command for the given axes as bytes (no str round-trip)."""
+    parts = [b"G0"]
+    append = parts.append
+    if speed is not None:
+        append(b" F%.4f" % speed)
+    if X is not None:
+        append(b" X%.4f" % X)
+    if Y is not None:
+        append(b" Y%.4f" % Y)
+    if Z is not None:
+        append(b" Z%.4f" % Z)
+    append(b"\n")
+    return b"".join(parts)
+
 
 class RoboCam:
     """
@@ -35,8 +64,21 @@ class RoboCam:
         X (float): Current X position in mm
         Y (float): Current Y position in mm
         Z (float): Current Z position in mm
+    
+    After a move, X/Y/Z are refreshed with M114 on their next read rather than after
+    every move, so read them from the thread that drives the printer. That read
+    raises RuntimeError if the query fails (the position is then unknown).
     """
     
+    # Fixed attribute set: slot descriptors instead of a per-instance __dict__ for the
+    # fields read on every command (subclasses without __slots__ still get a __dict__)
+    __slots__ = (
+        'config', 'baud_rate', 'timeout', 'readline_timeout', 'home_timeout', 'movement_wait_timeout',
+        'command_delay', 'connection_retry_delay', 'max_retries', 'simulate', 'simulate_3d',
+        '_x', '_y', '_z', '_position_dirty', 'printer_on_serial', '_rx_buf', '_abs_mode',
+        '_m400_supported',
+    )
+    
     def __init__(self, baudrate: Optional[int] = None, config: Optional[Config] = None, simulate_3d: bool = False) -> None:
         """
         Initialize RoboCam and connect to printer.
@@ -62,10 +104,13 @@ class RoboCam:
         # Printer startup and settings
         self.baud_rate: int = baudrate if baudrate is not None else printer_config.get("baudrate", 115200)
         self.timeout: float = printer_config.get("timeout", 1.0)
+        # Port-level read timeout: bounds a single blocking read so the per-command
+        # deadlines (timeout, home_timeout, ...) are enforced promptly
+        self.readline_timeout: float = printer_config.get("readline_timeout", 0.05)
         self.home_timeout: float = printer_config.get("home_timeout", 45.0)
         self.movement_wait_timeout: float = printer_config.get("movement_wait_timeout", 30.0)
-        self.command_delay: float = printer_config.get("command_delay", 0.1)
-        self.position_update_delay: float = printer_config.get("position_update_delay", 0.1)
+        self.command_delay: float = printer_config.get("command_delay", 0.1)  # Simulated command time only
+        self._log_ignored_printer_keys(printer_config)
         self.connection_retry_delay: float = printer_config.get("connection_retry_delay", 2.0)
         self.max_retries: int = printer_config.get("max_retries", 5)
         
@@ -73,11 +118,15 @@ class RoboCam:
         self.simulate: bool = simulate_3d  # Keep for backward compatibility
         self.simulate_3d: bool = simulate_3d
         
-        # Initialize position tracking
-        self.X: Optional[float] = None
-        self.Y: Optional[float] = None
-        self.Z: Optional[float] = None
+        # Initialize position tracking (backing fields of the X/Y/Z properties)
+        self._x: Optional[float] = None
+        self._y: Optional[float] = None
+        self._z: Optional[float] = None
+        self._position_dirty: bool = False  # Set by moves; X/Y/Z re-query M114 on next read
         self.printer_on_serial: Optional[serial.Serial] = None
+        self._rx_buf: bytearray = bytearray()  # Bytes read past the last line returned by _read_line
+        # Last positioning mode sent (True=G90, False=G91); None when unknown
+        self._abs_mode: Optional[bool] = None
         
         if self.simulate_3d:
             # Simulation mode: initialize position to origin
@@ -166,15 +215,82 @@ class RoboCam:
                 else:
                     raise ConnectionError(f"Failed to initialize RoboCam: {e}") from e
 
-    def send_gcode(self, command: str, timeout: Optional[float] = None, ignore_error_responses: bool = False) -> None:
+    @staticmethod
+    def _log_ignored_printer_keys(printer_config: dict) -> None:
+        """Log once per process when the config still sets printer keys that are now ignored."""
+        global _ignored_keys_logged
+        if _ignored_keys_logged:
+            return
+        ignored = [key for key in _IGNORED_PRINTER_KEYS if key in printer_config]
+        if ignored:
+            _ignored_keys_logged = True
+            logger.warning(
+                f"Printer config keys {', '.join(ignored)} are deprecated and ignored: "
+                "replies are awaited on the serial line instead of with fixed delays"
+            )
+
+    def _refresh_position(self) -> None:
+        """
+        Query the position after a move.
+
+        _position_dirty stays set until a query succeeds (update_current_position clears
+        it), so the next read retries. On failure the coordinates are cleared rather
+        than left at their pre-move values.
+
+        Raises:
+            RuntimeError: If the position query fails
+        """
+        try:
+            self.update_current_position()
+        except Exception as e:
+            self._x = self._y = self._z = None
+            raise RuntimeError(f"Position query failed: {e}") from e
+
+    @property
+    def X(self) -> Optional[float]:
+        """Current X position in mm (queried from the printer on first read after a move)."""
+        if self._position_dirty:
+            self._refresh_position()
+        return self._x
+
+    @X.setter
+    def X(self, value: Optional[float]) -> None:
+        self._x = value
+
+    @property
+    def Y(self) -> Optional[float]:
+        """Current Y position in mm (queried from the printer on first read after a move)."""
+        if self._position_dirty:
+            self._refresh_position()
+        return self._y
+
+    @Y.setter
+    def Y(self, value: Optional[float]) -> None:
+        self._y = value
+
+    @property
+    def Z(self) -> Optional[float]:
+        """Current Z position in mm (queried from the printer on first read after a move)."""
+        if self._position_dirty:
+            self._refresh_position()
+        return self._z
+
+    @Z.setter
+    def Z(self, value: Optional[float]) -> None:
+        self._z = value
+
+    def send_gcode(self, command: str, timeout: Optional[float] = None, ignore_error_responses: bool = False,
+                   acks: int = 1) -> None:
         """
         Send a G-code command to the printer and wait for acknowledgment.
         
         Args:
-            command: G-code command string to send (e.g., "G28", "G0 X10 Y20")
+            command: G-code command string to send (e.g., "G28", "G0 X10 Y20"). Several
+                newline-separated commands may be sent in one write (see acks).
             timeout: Timeout in seconds. If None, uses config timeout.
             ignore_error_responses: If True, log but do not raise on "error" lines; keep
                 waiting for "ok". Used for M999 recovery when printer echoes error first.
+            acks: Number of "ok" lines to wait for (one per command in command).
             
         Raises:
             ConnectionError: If printer is not connected (only in non-simulation mode)
@@ -191,6 +307,28 @@ class RoboCam:
             time.sleep(self.command_delay)  # Simulate command delay
             return
         
+        self._send_raw((command + '\n').encode('utf-8'), timeout, ignore_error_responses, acks, command=command)
+
+    def _send_raw(self, command_bytes: bytes, timeout: Optional[float] = None,
+                  ignore_error_responses: bool = False, acks: int = 1,
+                  command: Optional[str] = None) -> None:
+        """
+        Write pre-encoded, newline-terminated G-code and wait for acknowledgment.
+        
+        Fast path behind send_gcode() for callers that already hold the command as
+        bytes (e.g. moves built by _g0_command). Same replies, errors and timeouts
+        as send_gcode().
+        
+        Args:
+            command_bytes: Encoded command line(s), each ending in a newline
+            timeout: Timeout in seconds. If None, uses config timeout.
+            ignore_error_responses: See send_gcode()
+            acks: Number of "ok" lines to wait for
+            command: Command text for log and error messages (derived from command_bytes if None)
+        """
+        if command is None:
+            command = command_bytes.decode('utf-8', errors='replace').strip()
+        
         if self.printer_on_serial is None:
             raise ConnectionError("Printer not connected. Cannot send G-code command.")
         
@@ -201,56 +339,56 @@ class RoboCam:
         logger.debug(f'DEBUG: send_gcode - Connection state: is_open={self.printer_on_serial.is_open}, bytes_waiting={self.printer_on_serial.in_waiting}')
         
         try:
-            command_bytes = (command + '\n').encode('utf-8')
             logger.debug(f'DEBUG: send_gcode - Command bytes: {command_bytes.hex()} (length: {len(command_bytes)})')
             
             bytes_written = self.printer_on_serial.write(command_bytes)
             logger.debug(f'DEBUG: send_gcode - Wrote {bytes_written} bytes to serial port')
             self.printer_on_serial.flush()  # Ensure command is sent immediately
-            logger.debug(f'DEBUG: send_gcode - Command flushed, waiting {self.command_delay}s for processing...')
+            logger.debug('DEBUG: send_gcode - Command flushed')
             
-            time.sleep(self.command_delay)  # Initial delay for command processing
-            
-            start_time = time.time()
+            # No post-write delay: the firmware buffers the command, and the blocking
+            # readline below returns as soon as its reply line arrives
+            start_time = time.monotonic()
             response_count = 0
+            oks_received = 0
+            # Marlin replies are ASCII: match on raw bytes and only decode for logging
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             logger.debug(f'DEBUG: send_gcode - Starting response wait loop (timeout: {timeout}s)...')
             
             while True:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed > timeout:
                     logger.error(f'DEBUG: send_gcode - TIMEOUT after {elapsed:.2f}s waiting for response to "{command}"')
                     logger.error(f'DEBUG: send_gcode - Received {response_count} responses before timeout')
                     raise TimeoutError(f"G-code command '{command}' timed out after {timeout}s")
                 
-                bytes_waiting = self.printer_on_serial.in_waiting
-                if bytes_waiting > 0:
-                    response_count += 1
-                    raw_response = self.printer_on_serial.readline()
-                    try:
-                        response = raw_response.decode('utf-8', errors='replace').strip()
-                        logger.debug(f'DEBUG: send_gcode - Response #{response_count} ({elapsed:.3f}s): {repr(response)}')
-                        logger.debug(f'DEBUG: send_gcode - Raw response hex: {raw_response.hex()}')
-                    except Exception as e:
-                        logger.warning(f'DEBUG: send_gcode - Failed to decode response: {e}, raw: {raw_response.hex()}')
-                        continue
-                    
-                    if "ok" in response.lower():
-                        logger.debug(f'DEBUG: send_gcode - Received "ok" response for "{command}" after {elapsed:.3f}s')
+                # Blocks until a full line arrives or the time budget runs out; the
+                # kernel wakes us on data instead of polling in_waiting
+                raw_response = self._read_line(timeout - elapsed)
+                if not raw_response:
+                    logger.debug(f'DEBUG: send_gcode - Waiting for response... ({elapsed:.2f}s elapsed, {timeout - elapsed:.2f}s remaining)')
+                    continue
+                response_count += 1
+                if debug_enabled:
+                    logger.debug(f'DEBUG: send_gcode - Response #{response_count} ({elapsed:.3f}s): {repr(raw_response.decode("latin-1").strip())}')
+                    logger.debug(f'DEBUG: send_gcode - Raw response hex: {raw_response.hex()}')
+                
+                lowered = raw_response.lower()
+                if b"ok" in lowered:
+                    oks_received += 1
+                    if debug_enabled:
+                        logger.debug(f'DEBUG: send_gcode - Received "ok" response {oks_received}/{acks} for "{command}" after {elapsed:.3f}s')
+                    if oks_received >= acks:
                         break
-                    elif "error" in response.lower():
-                        if ignore_error_responses:
-                            logger.warning(f'send_gcode - Ignoring error response (recovery mode) for "{command}": {response}')
-                        else:
-                            logger.error(f'DEBUG: send_gcode - Printer returned ERROR for "{command}": {response}')
-                            raise RuntimeError(f"Printer error for command '{command}': {response}")
+                elif b"error" in lowered:
+                    response = raw_response.decode('latin-1').strip()
+                    if ignore_error_responses:
+                        logger.warning(f'send_gcode - Ignoring error response (recovery mode) for "{command}": {response}')
                     else:
-                        logger.debug(f'DEBUG: send_gcode - Non-ok response (continuing to wait): {response}')
-                else:
-                    # Log periodically when waiting
-                    if int(elapsed * 10) % 5 == 0:  # Every 0.5 seconds
-                        logger.debug(f'DEBUG: send_gcode - Waiting for response... ({elapsed:.2f}s elapsed, {timeout - elapsed:.2f}s remaining)')
-                
-                time.sleep(0.01)  # Small delay to avoid busy waiting
+                        logger.error(f'DEBUG: send_gcode - Printer returned ERROR for "{command}": {response}')
+                        raise RuntimeError(f"Printer error for command '{command}': {response}")
+                elif debug_enabled:
+                    logger.debug(f'DEBUG: send_gcode - Non-ok response (continuing to wait): {raw_response.decode("latin-1").strip()}')
                 
         except serial.SerialException as e:
             logger.error(f'DEBUG: send_gcode - Serial exception: {type(e).__name__}: {e}')
@@ -272,41 +410,49 @@ class RoboCam:
             Device path of first available USB serial port, or None if none found.
             
         Note:
-            Tests each USB port by attempting to open it. Returns the first
-            port that can be opened successfully.
+            Tests the USB ports by attempting to open them (in parallel when there
+            are several). Returns the first port, in enumeration order, that can be
+            opened successfully.
             
         Raises:
             serial.SerialException: If port enumeration fails
         """
         try:
             logger.debug("DEBUG: Starting serial port discovery...")
-            ports = serial.tools.list_ports.comports()
-            logger.debug(f"DEBUG: Found {len(ports)} total serial ports")
-            
-            for port in ports:
-                logger.debug(f"DEBUG: Available port: {port.device} - {port.description} (VID:{port.vid}, PID:{port.pid})")
+            if logger.isEnabledFor(logging.DEBUG):
+                ports = serial.tools.list_ports.comports()
+                logger.debug(f"DEBUG: Found {len(ports)} total serial ports")
+                for port in ports:
+                    logger.debug(f"DEBUG: Available port: {port.device} - {port.description} (VID:{port.vid}, PID:{port.pid})")
             
-            usb_ports = [port for port in ports if 'USB' in port.description.upper()]
+            # Case-insensitive match on device name, description and hardware ID
+            usb_ports = list(serial.tools.list_ports.grep('USB'))
             logger.debug(f"DEBUG: Found {len(usb_ports)} USB serial ports")
             
             if not usb_ports:
                 logger.warning("No USB serial ports found.")
                 return None
 
-            for usb_port in usb_ports:
-                logger.debug(f"DEBUG: Testing USB port: {usb_port.device} ({usb_port.description})")
-                logger.debug(f"DEBUG: Attempting to open port with baudrate={self.baud_rate}, timeout={self.timeout}s")
-                try:
-                    ser = serial.Serial(usb_port.device, self.baud_rate, timeout=self.timeout)
-                    logger.debug(f"DEBUG: Successfully opened port {usb_port.device}")
-                    logger.debug(f"DEBUG: Port settings: baudrate={ser.baudrate}, timeout={ser.timeout}, parity={ser.parity}")
-                    ser.close()  # Close the port now that we know it works
-                    logger.info(f"Selected port: {usb_port.device} - {usb_port.description}")
-                    logger.debug(f"DEBUG: Port closed after test, returning port path")
-                    return usb_port.device
-                except serial.SerialException as e:
-                    logger.warning(f"DEBUG: Failed to connect on {usb_port.device}: {e}")
-                    continue
+            pool = None
+            if len(usb_ports) > 1:
+                # Probe all ports at once (a slow open no longer delays the others), but
+                # still pick the first working port in enumeration order
+                pool = ThreadPoolExecutor(max_workers=len(usb_ports), thread_name_prefix="PortProbe")
+                futures = [pool.submit(self._probe_serial_port, port) for port in usb_ports]
+                results = (future.result() for future in futures)
+            else:
+                results = (self._probe_serial_port(port) for port in usb_ports)
+            try:
+                for usb_port, ok in zip(usb_ports, results):
+                    if ok:
+                        logger.info(f"Selected port: {usb_port.device} - {usb_port.description}")
+                        return usb_port.device
+            finally:
+                if pool is not None:
+                    # Drop probes that haven't started (shutdown(cancel_futures=...) needs 3.9)
+                    for future in futures:
+                        future.cancel()
+                    pool.shutdown(wait=False)
 
             logger.warning("No available ports responded.")
             return None
@@ -316,6 +462,40 @@ class RoboCam:
             logger.exception("DEBUG: Exception details:")
             return None
 
+    def _probe_serial_port(self, usb_port) -> bool:
+        """Return True if the port can be opened with the configured settings (closed again right away)."""
+        logger.debug(f"DEBUG: Testing USB port: {usb_port.device} ({usb_port.description})")
+        logger.debug(f"DEBUG: Attempting to open port with baudrate={self.baud_rate}, timeout={self.timeout}s")
+        try:
+            ser = serial.Serial(usb_port.device, self.baud_rate, timeout=self.timeout)
+        except serial.SerialException as e:
+            logger.warning(f"DEBUG: Failed to connect on {usb_port.device}: {e}")
+            return False
+        logger.debug(f"DEBUG: Successfully opened port {usb_port.device}")
+        logger.debug(f"DEBUG: Port settings: baudrate={ser.baudrate}, timeout={ser.timeout}, parity={ser.parity}")
+        ser.close()  # Close the port now that we know it works
+        logger.debug(f"DEBUG: Port {usb_port.device} closed after test")
+        return True
+
+    def _enable_low_latency(self) -> None:
+        """
+        Ask the tty driver to push received bytes immediately (ASYNC_LOW_LATENCY).
+
+        Without it USB-serial adapters (FTDI in particular) hold incoming data for
+        their latency timer, which delays every "ok" by several milliseconds. Uses
+        pyserial's set_low_latency_mode (TIOCGSERIAL/TIOCSSERIAL on Linux); ports or
+        platforms that don't support it are left as they are.
+        """
+        set_low_latency = getattr(self.printer_on_serial, "set_low_latency_mode", None)
+        if set_low_latency is None:
+            logger.debug("DEBUG: Low-latency mode not available on this platform")
+            return
+        try:
+            set_low_latency(True)
+            logger.debug("DEBUG: Enabled low-latency mode on serial port")
+        except (OSError, ValueError) as e:
+            logger.debug(f"DEBUG: Could not enable low-latency mode (not supported by this port): {e}")
+
     def wait_for_connection(self, serial_port: str) -> serial.Serial:
         """
         Attempt to open a serial connection and wait until it is established.
@@ -335,7 +515,7 @@ class RoboCam:
             Waits 1 second after connection for printer to initialize.
         """
         logger.debug(f"DEBUG: wait_for_connection called for port: {serial_port}")
-        logger.debug(f"DEBUG: Connection settings: baudrate={self.baud_rate}, timeout={self.timeout}s, max_retries={self.max_retries}")
+        logger.debug(f"DEBUG: Connection settings: baudrate={self.baud_rate}, read timeout={self.readline_timeout}s, max_retries={self.max_retries}")
         
         retries = 0
         while retries < self.max_retries:
@@ -344,8 +524,13 @@ class RoboCam:
                 self.printer_on_serial = serial.Serial(
                     serial_port, 
                     self.baud_rate, 
-                    timeout=self.timeout
+                    timeout=self.readline_timeout,
+                    xonxoff=False,  # Marlin uses no flow control; explicit so a stray XOFF can't stall replies
+                    rtscts=False,
                 )
+                self._enable_low_latency()
+                self._abs_mode = None  # Fresh connection: positioning mode unknown
+                self._rx_buf.clear()
                 logger.info(f"Connected to {serial_port} at {self.baud_rate} baud. Waiting for printer to initialize...")
                 logger.debug(f"DEBUG: Serial connection opened successfully")
                 logger.debug(f"DEBUG: Connection state - is_open: {self.printer_on_serial.is_open}, bytes_waiting: {self.printer_on_serial.in_waiting}")
@@ -439,6 +624,45 @@ class RoboCam:
         time.sleep(fallback_delay)
         logger.debug("DEBUG: wait_for_movement_completion - Delay completed")
     
+    def _read_line(self, timeout: float) -> bytes:
+        """
+        Return the next line from the printer (newline included), or b'' on timeout.
+        
+        Blocks in select() on the port's file descriptor and reads whatever has arrived
+        with a single os.read(), keeping bytes past the newline for the next call. Ports
+        without a selectable descriptor fall back to pyserial's readline().
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        buf = self._rx_buf
+        nl = buf.find(b'\n')
+        if nl < 0:
+            try:
+                fd = self.printer_on_serial.fileno()
+            except (AttributeError, OSError, ValueError):
+                return self.printer_on_serial.readline()
+            deadline = time.monotonic() + timeout
+            while nl < 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return b''
+                ready, _, _ = select.select([fd], [], [], remaining)
+                if not ready:
+                    return b''
+                try:
+                    data = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    raise serial.SerialException("Printer serial port returned no data (device disconnected?)")
+                start = len(buf)
+                buf += data
+                nl = buf.find(b'\n', start)
+        line = bytes(buf[:nl + 1])
+        del buf[:nl + 1]
+        return line
+
     def dump_printer_output(self) -> None:
         """
         Read and print all pending output from printer.
@@ -449,15 +673,24 @@ class RoboCam:
         """
         bytes_read = 0
         lines_read = 0
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         logger.debug(f"DEBUG: dump_printer_output - initial bytes waiting: {self.printer_on_serial.in_waiting}")
         
+        if self._rx_buf:
+            # Discard bytes already read from the port by _read_line
+            bytes_read += len(self._rx_buf)
+            if debug_enabled:
+                logger.debug(f'DEBUG: Printer output (buffered): {repr(self._rx_buf.decode("latin-1"))}')
+            self._rx_buf.clear()
+        
         while self.printer_on_serial.in_waiting > 0:  # Check if there's data waiting to be read
             try:
                 raw_response = self.printer_on_serial.readline()
                 bytes_read += len(raw_response)
                 lines_read += 1
-                response = raw_response.decode('utf-8', errors='replace').strip()
-                logger.debug(f'DEBUG: Printer output line {lines_read}: {repr(response)} (raw: {raw_response.hex()})')
+                if debug_enabled:
+                    response = raw_response.decode('latin-1').strip()
+                    logger.debug(f'DEBUG: Printer output line {lines_read}: {repr(response)} (raw: {raw_response.hex()})')
             except Exception as e:
                 logger.warning(f"DEBUG: Error reading printer output: {e}")
                 break
@@ -581,6 +814,7 @@ class RoboCam:
                 # Send M999 with ignore_error_responses=True - printer echoes error first,
                 # then processes M999 and sends "ok". Marlin restart can take 10-15s.
                 self.send_gcode("M999", timeout=20.0, ignore_error_responses=True)
+                self._abs_mode = None  # Firmware restarted: positioning mode back to its default
                 # Wait for printer to fully reset after M999
                 time.sleep(2.0)
                 # Clear any post-reset messages
@@ -610,6 +844,28 @@ class RoboCam:
         logger.error(f"M999 recovery failed after {max_attempts} attempts")
         return False
 
+    def _set_positioning_mode(self, absolute: bool) -> None:
+        """Send G90/G91 only when the printer is not already in the requested mode."""
+        if self._abs_mode is absolute:
+            return
+        self._abs_mode = None  # Unknown until the printer acknowledges
+        self.send_gcode('G90' if absolute else 'G91')
+        self._abs_mode = absolute
+
+    def _send_move(self, command_bytes: bytes) -> None:
+        """
+        Send a newline-terminated move command and wait for it to complete.
+        
+        When M400 is supported it is sent in the same write as the move; Marlin executes
+        buffered commands in order and acknowledges each, so one round-trip covers both.
+        Otherwise falls back to wait_for_movement_completion().
+        """
+        if getattr(self, '_m400_supported', False):
+            self._send_raw(command_bytes + b"M400\n", timeout=self.movement_wait_timeout, acks=2)
+        else:
+            self._send_raw(command_bytes)
+            self.wait_for_movement_completion(timeout=self.movement_wait_timeout)
+
     def update_current_position(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """
         Query printer for current position and update internal state.
@@ -640,49 +896,55 @@ class RoboCam:
             # Manually sending command because send_gcode dumps all output before "ok" response
             command = "M114"
             self.printer_on_serial.write((command + '\n').encode('utf-8'))
-            time.sleep(self.position_update_delay)
             
             # Parse printer's response with timeout
-            start_time = time.time()
-            response = ""
+            deadline = time.monotonic() + self.timeout
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             while True:
-                if time.time() - start_time > self.timeout:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     raise TimeoutError(f"Position update timed out after {self.timeout}s")
                 
-                if self.printer_on_serial.in_waiting > 0:
-                    response = self.printer_on_serial.readline().decode('utf-8').strip()
-                    logger.debug(f'Printer response: {response}')
-                    if response.startswith('X:'):
-                        break
-                
-                time.sleep(0.01)
+                raw_response = self._read_line(remaining)
+                if not raw_response:
+                    continue
+                if debug_enabled:
+                    logger.debug(f'Printer response: {raw_response.decode("latin-1").strip()}')
+                if raw_response.lstrip().startswith(b'X:'):
+                    break
             
-            # Parse position values
+            # Parse position values straight from the bytes (first occurrence of each
+            # axis wins; the stepper "Count" section repeats the axes later in the line)
             position = {}
-            matches = re.findall(r'(X|Y|Z):([0-9.-]+)', response)
-            collected_axes = set()
-            
-            for axis, value in matches:
-                try:
-                    if axis not in collected_axes:
-                        position[axis] = float(value)
-                        collected_axes.add(axis)
-                except ValueError as e:
-                    logger.warning(f"Could not parse {axis} value '{value}': {e}")
-                    continue
+            for m in _M114_RE.finditer(raw_response):
+                position.setdefault(m.group(1), float(m.group(2)))
             
             if not position:
-                raise ValueError(f"Could not parse position from response: {response}")
+                raise ValueError(f"Could not parse position from response: {raw_response.decode('latin-1').strip()}")
                     
             # Save XYZ values
-            self.X = position.get('X', None)
-            self.Y = position.get('Y', None)
-            self.Z = position.get('Z', None)
+            x = position.get(b'X')
+            y = position.get(b'Y')
+            z = position.get(b'Z')
             
-            # Dump remaining printer output
-            self.dump_printer_output()
+            # Consume M114's trailing "ok" so the next command doesn't take it as its own ack
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Position update timed out after {self.timeout}s waiting for 'ok'")
+                
+                raw_response = self._read_line(remaining)
+                if not raw_response:
+                    continue
+                if debug_enabled:
+                    logger.debug(f'Printer response: {raw_response.decode("latin-1").strip()}')
+                if raw_response.lstrip().startswith(b'ok'):
+                    break
             
-            return position.get('X', None), position.get('Y', None), position.get('Z', None)
+            self._x, self._y, self._z = x, y, z
+            self._position_dirty = False
+            
+            return x, y, z
             
         except serial.SerialException as e:
             raise ConnectionError(f"Serial communication error during position update: {e}") from e
@@ -704,9 +966,9 @@ class RoboCam:
             ValueError: If position values are invalid
             
         Note:
-            Uses G91 (relative positioning mode).
+            Uses G91 (relative positioning mode), sent only when not already active.
             Sends M400 to wait for movement completion before returning.
-            Updates position after movement.
+            Marks the position stale; X/Y/Z query it with M114 on their next read.
             In simulation mode, just updates internal position tracking.
         """
         # Validate that at least one axis is specified
@@ -734,21 +996,10 @@ class RoboCam:
         logger.debug(f'Relative move to X:{X}, Y:{Y}, Z:{Z}')
         
         try:
-            self.send_gcode('G91')
-            command = "G0"
-
-            if speed is not None:
-                command += f" F{speed}"
-            if X is not None:
-                command += f" X{X}"
-            if Y is not None:
-                command += f" Y{Y}"
-            if Z is not None:
-                command += f" Z{Z}"
-
-            self.send_gcode(command)
-            self.wait_for_movement_completion(timeout=self.movement_wait_timeout)
-            self.update_current_position()
+            self._set_positioning_mode(absolute=False)
+            self._send_move(_g0_command(X, Y, Z, speed))
+            # M400 already guarantees completion; the position is queried lazily
+            self._position_dirty = True
         except Exception as e:
             raise RuntimeError(f"Relative movement failed: {e}") from e
             
@@ -769,9 +1020,9 @@ class RoboCam:
             ValueError: If position values are invalid
             
         Note:
-            Uses G90 (absolute positioning mode).
+            Uses G90 (absolute positioning mode), sent only when not already active.
             Sends M400 to wait for movement completion before returning.
-            Updates position after movement.
+            Marks the position stale; X/Y/Z query it with M114 on their next read.
             In simulation mode, just updates internal position tracking.
         """
         # Validate that at least one axis is specified
@@ -799,21 +1050,10 @@ class RoboCam:
         logger.debug(f'Absolute move to X:{X}, Y:{Y}, Z:{Z}')
         
         try:
-            self.send_gcode('G90')
-            command = "G0"
-
-            if speed is not None:
-                command += f" F{speed}"
-            if X is not None:
-                command += f" X{X}"
-            if Y is not None:
-                command += f" Y{Y}"
-            if Z is not None:
-                command += f" Z{Z}"
-
-            self.send_gcode(command)
-            self.wait_for_movement_completion(timeout=self.movement_wait_timeout)
-            self.update_current_position()
+            self._set_positioning_mode(absolute=True)
+            self._send_move(_g0_command(X, Y, Z, speed))
+            # M400 already guarantees completion; the position is queried lazily
+            self._position_dirty = True
         except Exception as e:
             raise RuntimeError(f"Absolute movement failed: {e}") from e
         
@@ -18,11 +18,63 @@ import cv2
 import atexit
 import time
 import os
+import shutil
+import struct
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from robocam.logging_config import get_logger
 
+try:
+    import fcntl
+    import termios
+except ImportError:  # Not available on Windows; the reader then reads one frame at a time
+    fcntl = None
+    termios = None
+
 logger = get_logger(__name__)
 
+# rpicam-vid executable, resolved once at import (None when libcamera-apps is not installed)
+_RPICAM_VID = shutil.which("rpicam-vid")
+
+# Fast PNG compression for frame dumps (default level 3 roughly doubles encode time)
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
+def _pipe_bytes_available(fd: int) -> int:
+    """Return the number of bytes waiting in a pipe (FIONREAD), or 0 if unknown."""
+    if fcntl is None:
+        return 0
+    try:
+        return struct.unpack("i", fcntl.ioctl(fd, termios.FIONREAD, b"\0\0\0\0"))[0]
+    except OSError:
+        return 0
+
+
+def _read_full(fd: int, view: memoryview) -> int:
+    """
+    Fill view from a pipe fd with os.readv, looping over short reads.
+
+    Reads go straight from the kernel into the caller's buffer (no io.BufferedReader
+    layer or intermediate bytes object).
+
+    Args:
+        fd: Pipe file descriptor
+        view: Writable byte view to fill completely
+
+    Returns:
+        Number of bytes read; less than len(view) only at EOF
+    """
+    size = len(view)
+    filled = os.readv(fd, [view])
+    while filled and filled < size:
+        n = os.readv(fd, [view[filled:]])
+        if not n:
+            break
+        filled += n
+    return filled
+
 
 class RpicamVidCapture:
     """
@@ -40,9 +92,12 @@ class RpicamVidCapture:
         process (Optional[sp.Popen]): Subprocess running rpicam-vid
         frames (List[np.ndarray]): Buffer for captured frames
         _recording (bool): Whether currently recording frames
+    
+    A background reader thread drains the rpicam-vid pipe and publishes the latest
+    frame, so read_frame() never blocks on pipe I/O.
     """
     
-    def __init__(self, width: int = 640, height: int = 480, fps: int = 250) -> None:
+    def __init__(self, width: int = 640, height: int = 480, fps: int = 250, ring_size: int = 8) -> None:
         """
         Initialize rpicam-vid capture.
         
@@ -50,6 +105,8 @@ class RpicamVidCapture:
             width: Frame width in pixels (should be multiple of 32 for optimal performance)
             height: Frame height in pixels (should be multiple of 16 for optimal performance)
             fps: Target frames per second
+            ring_size: Number of preallocated frame slots the reader cycles through; a frame
+                returned by read_frame() stays valid until this many newer frames arrive
         """
         self.width: int = width
         self.height: int = height
@@ -59,9 +116,29 @@ class RpicamVidCapture:
         self.bytes_per_frame: int = width * height * 3 // 2
         self.y_bytes_per_frame: int = width * height
         self.process: Optional[sp.Popen] = None
+        self._fd: Optional[int] = None  # rpicam-vid stdout pipe fd, read with os.readv
         self.frames: List[np.ndarray] = []
         self._recording: bool = False
+        # Disk-backed frame store for bounded buffered recordings (see start_recording)
+        self._frame_store: Optional[np.memmap] = None
+        self._stored_frames: int = 0
+        # FFmpeg encoder fed straight from the reader thread when recording to a file
+        self._ffmpeg_process: Optional[sp.Popen] = None
         self.last_error: Optional[str] = None
+        # Latest frame published by the reader thread; _frame_seq counts frames read
+        self._frame_cond = threading.Condition()
+        self._latest: Optional[np.ndarray] = None
+        self._frame_seq: int = 0
+        self._last_read_seq: int = 0  # Sequence of the frame last returned by read_frame
+        self._reader: Optional[threading.Thread] = None
+        self._reader_done: bool = False
+        # Preallocated YUV420 frame slots filled in place by the reader (no per-frame allocation)
+        self._ring_size = max(2, ring_size)
+        self._ring = np.empty((self._ring_size, self.bytes_per_frame), dtype=np.uint8)
+        self._ring_views = [memoryview(self._ring[i]).cast('B') for i in range(self._ring_size)]
+        self._ring_frames = [
+            self._ring[i, :self.y_bytes_per_frame].reshape((height, width)) for i in range(self._ring_size)
+        ]
         
     def start_capture(self) -> bool:
         """
@@ -75,26 +152,11 @@ class RpicamVidCapture:
             logger.warning("Capture already started")
             return False
         
-        # Check if rpicam-vid is available
-        try:
-            result = sp.run(["rpicam-vid", "--help"], 
-                           stdout=sp.DEVNULL, stderr=sp.DEVNULL, timeout=2)
-            if result.returncode != 0:
-                logger.error("rpicam-vid command failed. Please install libcamera-apps: sudo apt-get install -y libcamera-apps")
-                self.last_error = "rpicam-vid command failed"
-                return False
-        except FileNotFoundError:
+        # Check if rpicam-vid is available (PATH lookup cached at import; no probe process)
+        if _RPICAM_VID is None:
             logger.error("rpicam-vid command not found. Please install libcamera-apps: sudo apt-get install -y libcamera-apps")
             self.last_error = "rpicam-vid not found"
             return False
-        except sp.TimeoutExpired:
-            logger.error("rpicam-vid command timed out. Camera may be in use by another process.")
-            self.last_error = "rpicam-vid timed out (camera busy?)"
-            return False
-        except Exception as e:
-            logger.error(f"Error checking rpicam-vid availability: {e}")
-            self.last_error = str(e)
-            return False
         
         # Build rpicam-vid command
         # -t 0: continuous video (no timeout)
@@ -102,7 +164,7 @@ class RpicamVidCapture:
         # --output -: send output to stdout
         # -n: no preview window
         video_cmd = [
-            "rpicam-vid",
+            _RPICAM_VID,
             "-t", "0",
             "--codec", "yuv420",
             "--width", str(self.width),
@@ -144,19 +206,20 @@ class RpicamVidCapture:
             
             # Register cleanup on exit
             atexit.register(self.stop_capture)
+            self._fd = self.process.stdout.fileno()
             
-            # Wait for first frame and discard it (warmup)
+            # Wait for first frame and discard it (warmup; read into a ring slot)
             try:
-                raw_stream = self.process.stdout.read(self.bytes_per_frame)
-                if len(raw_stream) != self.bytes_per_frame:
+                n_read = _read_full(self._fd, self._ring_views[0])
+                if n_read != self.bytes_per_frame:
                     stderr_output = ""
                     if self.process.stderr:
                         try:
                             stderr_output = self.process.stderr.read().decode('utf-8', errors='ignore')[:200]
                         except:
                             pass
-                    logger.error(f"Failed to read initial frame. Expected {self.bytes_per_frame} bytes, got {len(raw_stream)}. Error: {stderr_output}")
-                    self.last_error = f"init frame short read ({len(raw_stream)}/{self.bytes_per_frame}) {stderr_output}"
+                    logger.error(f"Failed to read initial frame. Expected {self.bytes_per_frame} bytes, got {n_read}. Error: {stderr_output}")
+                    self.last_error = f"init frame short read ({n_read}/{self.bytes_per_frame}) {stderr_output}"
                     self.stop_capture()
                     return False
             except Exception as e:
@@ -165,6 +228,13 @@ class RpicamVidCapture:
                 self.stop_capture()
                 return False
             
+            # Drain the pipe continuously from here on
+            self._reader_done = False
+            self._reader = threading.Thread(
+                target=self._reader_loop, args=(self._fd,), name="RpicamVidReader", daemon=True
+            )
+            self._reader.start()
+            
             logger.info(f"Rpicam-vid capture started: {self.width}x{self.height} @ {self.fps} FPS")
             return True
             
@@ -175,72 +245,131 @@ class RpicamVidCapture:
                 self.stop_capture()
             return False
     
-    def read_frame(self) -> Optional[np.ndarray]:
+    def _reader_loop(self, fd: int) -> None:
+        """
+        Reader thread: read whole YUV420 frames from the pipe and publish the Y plane.
+        
+        Runs until the pipe reaches EOF (process exited or stop_capture() terminated it).
+        While recording, every frame is also appended to self.frames (or written into
+        the memory-mapped frame store when recording with max_frames).
+        
+        When the reader has fallen behind and several frames are already waiting in
+        the pipe, they are read with a single os.readv() scattered over consecutive
+        ring slots (at most half the ring, so recently returned frames stay intact).
+        
+        Args:
+            fd: rpicam-vid stdout pipe file descriptor
         """
-        Read a single frame from the camera stream.
+        frame_size = self.bytes_per_frame
+        ring_views = self._ring_views
+        ring_frames = self._ring_frames
+        ring_size = self._ring_size
+        max_batch = max(1, ring_size // 2)
+        idx = 0
+        try:
+            while True:
+                batch = 1
+                if max_batch > 1:
+                    batch = max(1, min(_pipe_bytes_available(fd) // frame_size, max_batch))
+                slots = [(idx + j) % ring_size for j in range(batch)]
+                n = os.readv(fd, [ring_views[j] for j in slots])
+                if not n:
+                    return
+                complete, partial = divmod(n, frame_size)
+                if partial:
+                    # Pipe reads may stop mid-frame; finish that slot before publishing
+                    rest = ring_views[slots[complete]][partial:]
+                    if _read_full(fd, rest) != frame_size - partial:
+                        return
+                    complete += 1
+                # Y (luminance) plane views: first w*h bytes of each slot
+                frames = [ring_frames[j] for j in slots[:complete]]
+                idx = (idx + complete) % ring_size
+                with self._frame_cond:
+                    self._latest = frames[-1]
+                    self._frame_seq += complete
+                    self._frame_cond.notify_all()
+                if self._recording:
+                    encoder = self._ffmpeg_process
+                    if encoder is not None:
+                        # Streamed recording: hand the Y plane bytes to FFmpeg, no Python-side copy
+                        try:
+                            for frame in frames:
+                                encoder.stdin.write(frame.data)
+                        except (BrokenPipeError, ValueError, OSError) as e:
+                            if self._ffmpeg_process is encoder:  # Not closed by stop_recording()
+                                logger.error(f"FFmpeg pipe closed unexpectedly: {e}")
+                                self._recording = False
+                    elif self._frame_store is not None:
+                        # Bounded recording: copy into the memory-mapped store; the OS pages it out
+                        store = self._frame_store
+                        for frame in frames:
+                            if self._stored_frames >= len(store):
+                                logger.warning(f"Recording buffer full ({len(store)} frames), stopping recording")
+                                self._recording = False
+                                break
+                            store[self._stored_frames] = frame
+                            self._stored_frames += 1
+                    else:
+                        # The slot is overwritten ring_size frames later, so recordings keep a copy
+                        self.frames.extend(frame.copy() for frame in frames)
+        except (OSError, ValueError) as e:
+            # Pipe closed underneath us during stop_capture()
+            logger.debug(f"rpicam-vid reader stopped: {e}")
+        finally:
+            with self._frame_cond:
+                self._reader_done = True
+                self._frame_cond.notify_all()
+    
+    def read_frame(self, timeout: float = 0.1) -> Optional[np.ndarray]:
+        """
+        Return the next frame published by the reader thread.
+        
+        Waits (up to timeout) only for a frame newer than the one returned by the
+        previous call; if frames arrived in between, the latest one is returned
+        and the older ones are skipped.
+        
+        Args:
+            timeout: Maximum seconds to wait for a new frame
         
         Returns:
-            Grayscale frame as numpy array (height, width), or None if error
+            Grayscale frame as numpy array (height, width), or None if error. The array
+            is a view into the reader's ring buffer: copy it to keep it longer than
+            ring_size frames.
         """
         if self.process is None:
             logger.error("Capture not started")
             return None
         
-        # Check if subprocess is still alive
-        if self.process.poll() is not None:
-            # Process has terminated
+        with self._frame_cond:
+            if self._frame_seq == self._last_read_seq and not self._reader_done:
+                self._frame_cond.wait_for(
+                    lambda: self._frame_seq != self._last_read_seq or self._reader_done,
+                    timeout
+                )
+            if self._frame_seq != self._last_read_seq:
+                self._last_read_seq = self._frame_seq
+                return self._latest
+            if not self._reader_done:
+                logger.debug("rpicam-vid read timeout (no data available)")
+                return None
+        
+        # Reader hit EOF: the subprocess has terminated
+        process = self.process
+        if process is not None:
             stderr_output = ""
-            if self.process.stderr:
+            if process.stderr:
                 try:
-                    stderr_output = self.process.stderr.read().decode('utf-8', errors='ignore')
+                    stderr_output = process.stderr.read().decode('utf-8', errors='ignore')
                 except:
                     pass
-            logger.error(f"rpicam-vid process has terminated (returncode: {self.process.returncode}). Stderr: {stderr_output[:500]}")
-            return None
-        
-        try:
-            # Read raw YUV420 frame (w*h*3/2 bytes total) with a short timeout to avoid blocking forever
-            import select, os
-            # Use shorter timeout (0.1s) to allow more frequent checks and faster failure detection
-            timeout_seconds = 0.1
-            rlist, _, _ = select.select([self.process.stdout], [], [], timeout_seconds)
-            if not rlist:
-                # Check again if process is still alive after timeout
-                if self.process.poll() is not None:
-                    logger.error("rpicam-vid process terminated during read timeout")
-                    return None
-                logger.debug("rpicam-vid read timeout (no data available)")
-                return None
-            
-            # Check process status one more time before reading
-            if self.process.poll() is not None:
-                logger.error("rpicam-vid process terminated before read")
-                return None
-            
-            # Read with a limit to prevent blocking too long
-            # Use os.read with the exact number of bytes needed
-            frame_bytes = os.read(self.process.stdout.fileno(), self.bytes_per_frame)
-            
-            if len(frame_bytes) != self.bytes_per_frame:
-                logger.warning(f"Read incomplete frame: {len(frame_bytes)}/{self.bytes_per_frame} bytes")
-                return None
-            
-            # Extract Y (luminance) channel - first w*h bytes
-            y_bytes = frame_bytes[:self.y_bytes_per_frame]
-            
-            # Convert Y channel to numpy array
-            frame = np.frombuffer(y_bytes, dtype=np.uint8)
-            frame = frame.reshape((self.height, self.width))
-            
-            return frame
-            
-        except Exception as e:
-            logger.error(f"Error reading frame: {e}")
-            return None
+            logger.error(f"rpicam-vid process has terminated (returncode: {process.poll()}). Stderr: {stderr_output[:500]}")
+        return None
     
     def capture_frame_sequence(self, num_frames: int, 
                                save_individual: bool = False,
-                               output_dir: Optional[str] = None) -> List[np.ndarray]:
+                               output_dir: Optional[str] = None,
+                               return_frames: bool = True) -> List[np.ndarray]:
         """
         Capture a sequence of frames.
         
@@ -248,44 +377,146 @@ class RpicamVidCapture:
             num_frames: Number of frames to capture
             save_individual: If True, save each frame as PNG file
             output_dir: Directory to save individual frames (if save_individual is True)
+            return_frames: If False, frames are only written to disk and not kept in memory
             
         Returns:
-            List of captured frames as numpy arrays
+            List of captured frames as numpy arrays (empty if return_frames is False)
         """
         frames = []
         start_time = time.time()
+        # PNG encoding runs on worker threads (libpng releases the GIL) so it does not
+        # slow down the capture loop
+        writer = ThreadPoolExecutor(max_workers=os.cpu_count() or 1) if save_individual and output_dir else None
+        pending = []
+        count = 0
+        timestamp = time.strftime('%Y%m%d_%H%M%S')  # Same for the whole sequence
         
-        for i in range(num_frames):
-            frame = self.read_frame()
-            if frame is None:
-                logger.warning(f"Failed to capture frame {i+1}/{num_frames}")
-                continue
-            
-            frames.append(frame.copy())
-            
-            # Save individual frame if requested
-            if save_individual and output_dir:
-                timestamp = time.strftime('%Y%m%d_%H%M%S')
-                frame_path = os.path.join(output_dir, f"frame_{i:06d}_{timestamp}.png")
-                cv2.imwrite(frame_path, frame)
+        try:
+            for i in range(num_frames):
+                frame = self.read_frame()
+                if frame is None:
+                    logger.warning(f"Failed to capture frame {i+1}/{num_frames}")
+                    continue
+                
+                # read_frame() returns a ring-buffer view that is reused later: take one
+                # copy, shared by the returned list and the PNG writer
+                frame = frame.copy()
+                if return_frames:
+                    frames.append(frame)
+                count += 1
+                
+                # Save individual frame if requested
+                if writer is not None:
+                    frame_path = os.path.join(output_dir, f"frame_{i:06d}_{timestamp}.png")
+                    pending.append(writer.submit(cv2.imwrite, frame_path, frame, _PNG_PARAMS))
+        finally:
+            if writer is not None:
+                writer.shutdown(wait=True)
+        
+        failed = sum(1 for f in pending if f.exception() is not None or not f.result())
+        if failed:
+            logger.warning(f"Failed to save {failed}/{len(pending)} frame PNGs to {output_dir}")
         
         elapsed = time.time() - start_time
         if elapsed > 0:
-            actual_fps = len(frames) / elapsed
-            logger.info(f"Captured {len(frames)} frames in {elapsed:.2f}s ({actual_fps:.1f} FPS)")
+            actual_fps = count / elapsed
+            logger.info(f"Captured {count} frames in {elapsed:.2f}s ({actual_fps:.1f} FPS)")
         
         return frames
     
-    def start_recording(self) -> None:
-        """Start recording frames to buffer."""
+    def start_recording(self, output_path: Optional[str] = None,
+                        codec: str = "ffv1",
+                        ffmpeg_path: str = "ffmpeg",
+                        max_frames: Optional[int] = None,
+                        spill_dir: Optional[str] = None) -> bool:
+        """
+        Start recording frames.
+        
+        Without output_path, frames are buffered in self.frames for save_frames_to_video()
+        or save_frames_to_png_sequence(). With output_path, the reader thread pipes raw
+        grayscale frames straight into an FFmpeg encoder instead, so memory use stays flat.
+        
+        With max_frames (and no output_path), frames are written into a preallocated
+        memory-mapped temporary file instead of a list of arrays, so long recordings
+        spill to disk through the page cache rather than growing process memory.
+        Recording stops by itself once max_frames frames are stored.
+        
+        Args:
+            output_path: Optional video file to encode to while recording
+            codec: FFmpeg video codec for streamed recording (default lossless FFV1)
+            ffmpeg_path: Path to FFmpeg executable
+            max_frames: Optional cap on buffered frames, backed by a memory-mapped file
+            spill_dir: Directory for the memory-mapped file (system temp dir if None)
+            
+        Returns:
+            True if recording started, False if the encoder or frame store could not be set up
+        """
         self.frames = []
+        self._frame_store = None
+        self._stored_frames = 0
+        if output_path is None and max_frames is not None:
+            try:
+                # Anonymous temp file: removed by the OS once the memmap is released
+                self._frame_store = np.memmap(
+                    tempfile.TemporaryFile(dir=spill_dir),
+                    dtype=np.uint8,
+                    mode="w+",
+                    shape=(max_frames, self.height, self.width)
+                )
+            except Exception as e:
+                logger.error(f"Failed to create recording frame store: {e}")
+                return False
+            logger.info(f"Recording up to {max_frames} frames into a memory-mapped frame store")
+        if output_path is not None:
+            cmd = [
+                ffmpeg_path, "-y",
+                "-f", "rawvideo",
+                "-pix_fmt", "gray",
+                "-s", f"{self.width}x{self.height}",
+                "-r", str(self.fps),
+                "-i", "-",
+                "-c:v", codec,
+            ]
+            if codec == "ffv1":
+                cmd += ["-level", "3"]
+            cmd.append(output_path)
+            try:
+                self._ffmpeg_process = sp.Popen(
+                    cmd,
+                    stdin=sp.PIPE,
+                    stdout=sp.DEVNULL,
+                    stderr=sp.DEVNULL
+                )
+            except FileNotFoundError:
+                logger.error(f"FFmpeg executable not found: {ffmpeg_path}")
+                return False
+            except Exception as e:
+                logger.error(f"Failed to start FFmpeg encoder: {e}")
+                return False
+            logger.info(f"Started FFmpeg encoder: {' '.join(cmd)}")
         self._recording = True
         logger.info("Started recording frames")
+        return True
     
     def stop_recording(self) -> None:
-        """Stop recording frames."""
+        """Stop recording frames (and finish the FFmpeg encode if streaming)."""
         self._recording = False
-        logger.info(f"Stopped recording. Captured {len(self.frames)} frames")
+        if self._frame_store is not None:
+            # Expose the filled part of the store; save_* iterate it like the frame list
+            self.frames = self._frame_store[:self._stored_frames]
+            self._frame_store = None
+        encoder = self._ffmpeg_process
+        if encoder is None:
+            logger.info(f"Stopped recording. Captured {len(self.frames)} frames")
+            return
+        self._ffmpeg_process = None
+        try:
+            if encoder.stdin:
+                encoder.stdin.close()
+            encoder.wait(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error stopping FFmpeg encoder: {e}")
+        logger.info("Stopped recording. FFmpeg encode finished")
     
     def is_recording(self) -> bool:
         """Check if currently recording."""
@@ -305,7 +536,7 @@ class RpicamVidCapture:
         Returns:
             True if successful, False otherwise
         """
-        if not self.frames:
+        if len(self.frames) == 0:
             logger.error("No frames to save")
             return False
         
@@ -331,10 +562,10 @@ class RpicamVidCapture:
             base_path = os.path.splitext(output_path)[0]
             output_path = base_path + ext
         
-        # Convert grayscale frames to BGR for video codec
-        # Most codecs require 3-channel images
+        # Write single-channel frames directly (FFV1/PNG accept 8-bit gray), avoiding a
+        # GRAY->BGR expansion that triples the data handed to the encoder
         height, width = self.frames[0].shape
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height), isColor=True)
+        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height), isColor=False)
         
         if not out.isOpened():
             logger.error(f"Failed to open video writer for {output_path}")
@@ -343,9 +574,7 @@ class RpicamVidCapture:
         logger.info(f"Saving {len(self.frames)} frames to {output_path} using {codec} codec @ {fps} FPS")
         
         for i, frame in enumerate(self.frames):
-            # Convert grayscale to BGR (3-channel)
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-            out.write(frame_bgr)
+            out.write(frame)
             
             if (i + 1) % 100 == 0:
                 logger.debug(f"Saved {i+1}/{len(self.frames)} frames")
@@ -365,7 +594,7 @@ class RpicamVidCapture:
         Returns:
             True if successful, False otherwise
         """
-        if not self.frames:
+        if len(self.frames) == 0:
             logger.error("No frames to save")
             return False
         
@@ -373,12 +602,13 @@ class RpicamVidCapture:
         
         logger.info(f"Saving {len(self.frames)} frames as PNG sequence to {output_dir}")
         
-        for i, frame in enumerate(self.frames):
-            frame_path = os.path.join(output_dir, f"{prefix}_{i:06d}.png")
-            cv2.imwrite(frame_path, frame)
-            
-            if (i + 1) % 100 == 0:
-                logger.debug(f"Saved {i+1}/{len(self.frames)} frames")
+        paths = [os.path.join(output_dir, f"{prefix}_{i:06d}.png") for i in range(len(self.frames))]
+        # zlib DEFLATE dominates PNG writes and releases the GIL: encode on all cores
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            results = list(pool.map(lambda path, frame: cv2.imwrite(path, frame, _PNG_PARAMS), paths, self.frames))
+        failed = results.count(False)
+        if failed:
+            logger.warning(f"Failed to write {failed}/{len(results)} PNG frames")
         
         logger.info(f"Successfully saved {len(self.frames)} PNG frames to {output_dir}")
         return True
@@ -396,6 +626,12 @@ class RpicamVidCapture:
                 logger.warning(f"Error stopping process: {e}")
             finally:
                 self.process = None
-                self._recording = False
+                self._fd = None
+                if self._recording or self._ffmpeg_process is not None:
+                    self.stop_recording()
+                # Terminating the process closes the pipe, so the reader sees EOF
+                if self._reader is not None:
+                    self._reader.join(timeout=2.0)
+                    self._reader = None
                 logger.info("Rpicam-vid capture stopped")
 